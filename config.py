@@ -184,6 +184,9 @@ CHANGE_HISTORY_COLUMNS: List[str] = [
     "Marketplace",
 ]
 
+# Read buffer for streaming the change history CSV (1 MiB)
+CSV_READ_BUFFER_SIZE: int = 1 << 20
+
 # =============================================================================
 # DATE FORMATS
 # =============================================================================
@@ -210,6 +213,9 @@ API_RETRY_DELAY: float = 2.0  # Base delay in seconds
 API_RETRY_MULTIPLIER: float = 2.0  # Exponential backoff multiplier
 API_RETRY_MAX_DELAY: float = 10.0  # Maximum delay between retries
 
+# Rows requested per page when scanning a sheet in pages
+API_PAGE_SIZE: int = 500
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -48,6 +48,8 @@ print("Checking for differences...")
 print("=" * 50)
 
 differences = []
+# Column map and rows by ID per group, so each sheet is downloaded once
+sheets = {}
 for key, stored_value in processed.items():
     try:
         # Parse the key (format: "GROUP:ROW_ID:FIELD")
@@ -64,22 +66,29 @@ for key, stored_value in processed.items():
             continue
             
         # Get current value from Smartsheet
-        sheet = client.Sheets.get_sheet(SHEET_IDS[group])
-        
-        # Map column titles to IDs
-        col_map = {col.title: col.id for col in sheet.columns}
+        if group not in sheets:
+            sheet = client.Sheets.get_sheet(SHEET_IDS[group])
+            sheets[group] = (
+                {col.title: col.id for col in sheet.columns},
+                {str(r.id): r for r in sheet.rows},
+            )
+        col_map, rows_by_id = sheets[group]
         if field not in col_map:
             continue
             
         # Find the row
-        row = next((r for r in sheet.rows if str(r.id) == row_id), None)
+        row = rows_by_id.get(row_id)
         if not row:
             print(f"Row not found: {row_id} in {group}")
             continue
             
         # Get the cell value
-        cell = next((c for c in row.cells if c.column_id == col_map[field]), None)
-        current_value = cell.value if cell else None
+        column_id = col_map[field]
+        current_value = None
+        for cell in row.cells:
+            if cell.column_id == column_id:
+                current_value = cell.value
+                break
         
         # Compare with stored value
         if stored_value != current_value:
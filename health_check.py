@@ -18,12 +18,12 @@ Usage:
 import os
 import sys
 import json
+import mmap
 import argparse
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 from typing import Dict, List, Any, Optional
 
-import smartsheet
 from dotenv import load_dotenv
 
 # Import centralized configuration
@@ -198,24 +198,38 @@ class HealthCheck:
             return True
 
         try:
-            with open(CHANGES_FILE, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            total_records = len(lines) - 1  # Subtract header
-
             # Get recent changes (last 7 days)
+            line_count = 0
             recent_count = 0
             cutoff = datetime.now() - timedelta(days=7)
-
-            for line in lines[1:]:  # Skip header
-                parts = line.strip().split(',')
-                if len(parts) >= 6:
-                    try:
-                        change_date = datetime.strptime(parts[5], '%Y-%m-%d')
-                        if change_date >= cutoff:
-                            recent_count += 1
-                    except ValueError:
-                        pass
+            # Earliest YYYY-MM-DD date at or after the cutoff, as bytes, so
+            # ISO dates in the file can be compared without decoding/parsing
+            first_day = cutoff.date()
+            if cutoff.time() != datetime.min.time():
+                first_day += timedelta(days=1)
+            first_day_b = first_day.isoformat().encode('ascii')
+
+            # Walk the file through a read-only memory map in a single pass,
+            # rather than decoding it into a list of lines first
+            with open(CHANGES_FILE, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        mm.readline()  # Skip header
+                        line_count = 1
+                        for line in iter(mm.readline, b''):
+                            line_count += 1
+                            parts = line.split(b',', 6)
+                            if len(parts) >= 6:
+                                value = parts[5].strip()
+                                if value >= first_day_b:
+                                    # Only recent candidates are validated
+                                    try:
+                                        date.fromisoformat(value.decode('ascii'))
+                                        recent_count += 1
+                                    except (ValueError, UnicodeDecodeError):
+                                        pass
+
+            total_records = line_count - 1  # Subtract header
 
             self.results["checks"]["changes_file"] = {
                 "status": "passed",
@@ -246,6 +260,9 @@ class HealthCheck:
             return False
 
         try:
+            # Imported here so offline checks don't pay for the SDK import
+            import smartsheet
+
             client = smartsheet.Smartsheet(token)
             client.errors_as_exceptions(True)
 
@@ -280,6 +297,9 @@ class HealthCheck:
             return False
 
         try:
+            # Lazy import, as in check_smartsheet_api
+            import smartsheet
+
             client = smartsheet.Smartsheet(token)
             client.errors_as_exceptions(True)
 
@@ -61,36 +61,36 @@ for group, sid in SHEET_IDS.items():
         
         # Map column titles to IDs
         col_map = {col.title: col.id for col in sheet.columns}
+        date_cols = [
+            (date_col, col_map[date_col])
+            for date_col, _, _ in PHASE_FIELDS
+            if col_map.get(date_col)
+        ]
         
         # Process each row
         for row in sheet.rows:
-            for date_col, _, _ in PHASE_FIELDS:
-                col_id = col_map.get(date_col)
-                if not col_id:
-                    continue
-                    
-                # Find cell with this column ID
-                for cell in row.cells:
-                    if cell.column_id == col_id and cell.value:
-                        # Add to processed state with normalized date (YYYY-MM-DD)
-                        field_key = f"{group}:{row.id}:{date_col}"
-                        # Normalize to YYYY-MM-DD format
-                        val = cell.value
-                        if hasattr(val, 'date'):
-                            val = val.date().isoformat()
-                        elif hasattr(val, 'isoformat'):
-                            val = val.isoformat()
-                        else:
-                            val = str(val).strip()[:10]  # Take just YYYY-MM-DD part
-                        state["processed"][field_key] = val
-                        break
+            cells = {cell.column_id: cell for cell in row.cells}
+            for date_col, col_id in date_cols:
+                cell = cells.get(col_id)
+                if cell and cell.value:
+                    # Add to processed state with normalized date (YYYY-MM-DD)
+                    field_key = f"{group}:{row.id}:{date_col}"
+                    # Normalize to YYYY-MM-DD format
+                    val = cell.value
+                    if hasattr(val, 'date'):
+                        val = val.date().isoformat()
+                    elif hasattr(val, 'isoformat'):
+                        val = val.isoformat()
+                    else:
+                        val = str(val).strip()[:10]  # Take just YYYY-MM-DD part
+                    state["processed"][field_key] = val
     except Exception as e:
         print(f"Error processing sheet {group}: {e}")
         continue
 
 # Save state
 with open("tracking_data/tracker_state.json", "w") as f:
-    json.dump(state, f)
+    f.write(json.dumps(state))
 
 print(f"Created state file with {len(state['processed'])} processed items")
 print("System reset complete - tracking will now only capture new changes")
@@ -54,7 +54,7 @@ def save_state(state):
     """Save state to file."""
     try:
         with open(STATE_FILE, 'w') as f:
-            json.dump(state, f)
+            f.write(json.dumps(state))
             print(f"Saved state with {len(state.get('processed', {}))} processed items")
     except Exception as e:
         print(f"Error saving state: {e}")
@@ -87,21 +87,23 @@ def find_differences():
             found_fields = [f for f, _, _ in PHASE_FIELDS if f in col_map]
             print(f"Found tracked fields: {found_fields}")
             
+            # Resolve the tracked fields to column IDs once per sheet
+            field_cols = [
+                (date_col, col_map[date_col], col_map.get(user_col))
+                for date_col, user_col, _ in PHASE_FIELDS
+                if date_col in col_map
+            ]
+            
             # Process each row
             for row in sheet.rows:
-                for date_col, user_col, phase_no in PHASE_FIELDS:
-                    if date_col not in col_map:
-                        continue
-                    
+                # Both the date and the user cell of every field are read from this row
+                cells = {cell.column_id: cell for cell in row.cells}
+                for date_col, date_col_id, user_col_id in field_cols:
                     # Get current value from Smartsheet
-                    date_val = None
-                    user_val = ""
-                    
-                    for cell in row.cells:
-                        if cell.column_id == col_map.get(date_col):
-                            date_val = cell.value
-                        if cell.column_id == col_map.get(user_col):
-                            user_val = cell.display_value or ""
+                    date_cell = cells.get(date_col_id)
+                    date_val = date_cell.value if date_cell else None
+                    user_cell = cells.get(user_col_id)
+                    user_val = (user_cell.display_value or "").strip() if user_cell else ""
                     
                     if not date_val:
                         continue
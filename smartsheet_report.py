@@ -14,20 +14,23 @@ Author: Redesigned for Noctua Returns Department
 """
 
 import os
+import importlib.util
 import csv
 import json
+import pickle
+import hashlib
 from datetime import datetime, timedelta, date
+from calendar import monthrange
 from collections import defaultdict, Counter
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-# Optional imports for Smartsheet API
-try:
-    import smartsheet
-    SMARTSHEET_AVAILABLE = True
-except ImportError:
-    SMARTSHEET_AVAILABLE = False
-    smartsheet = None
+# Optional Smartsheet API; the SDK is slow to import, so it is only
+# located here and imported by get_client() on first use
+SMARTSHEET_AVAILABLE = importlib.util.find_spec("smartsheet") is not None
+smartsheet = None
 
 from dotenv import load_dotenv
 from reportlab.lib.pagesizes import A4
@@ -40,7 +43,7 @@ from reportlab.platypus import (
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.graphics.shapes import Drawing, String, Line, Rect, Circle, Wedge
+from reportlab.graphics.shapes import Drawing, Group, String, Line, Rect, Circle, Wedge
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.pdfbase.pdfmetrics import stringWidth
@@ -117,10 +120,20 @@ PHASE_SHORT = {
     "5": "P5",
 }
 
+# Product status summary fields, from most to least recently worked on
+STATUS_ORDER = ("Aktuell", "<30", "31 - 60", ">60")
+
 # Directories
 DATA_DIR = "tracking_data"
 REPORTS_DIR = "reports"
 CHANGES_FILE = os.path.join(DATA_DIR, "change_history.csv")
+CSV_READ_BUFFER_SIZE = 1 << 20  # 1 MiB reads for the change history CSV
+WEEKLY_REPORTS_DIR = os.path.join(REPORTS_DIR, "weekly")
+MONTHLY_REPORTS_DIR = os.path.join(REPORTS_DIR, "monthly")
+WEEKLY_REPORT_FILE = os.path.join(WEEKLY_REPORTS_DIR, "weekly_report_{}.pdf")
+MONTHLY_REPORT_FILE = os.path.join(MONTHLY_REPORTS_DIR, "monthly_report_{}.pdf")
+SHEET_CACHE_DIR = os.path.join(".cache", "sheets")
+SHEET_CACHE_TTL = 3600  # seconds a cached sheet is used without a version check
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
 # =============================================================================
@@ -138,6 +151,7 @@ class DesignSystem:
     
     # Neutral palette
     WHITE = colors.HexColor("#FFFFFF")
+    WHITE_OVERLAY = colors.Color(1, 1, 1, alpha=0.2)  # Semi-transparent white
     GRAY_50 = colors.HexColor("#F8FAFC")      # Lightest gray
     GRAY_100 = colors.HexColor("#F1F5F9")     # Very light gray
     GRAY_200 = colors.HexColor("#E2E8F0")     # Light gray
@@ -207,6 +221,30 @@ class DesignSystem:
         ">60": colors.HexColor("#DC2626"),       # Red - critical
     }
     
+    # Special activity colors
+    SPECIAL = colors.HexColor("#8B5CF6")      # Violet - special hours KPI
+    CATEGORY_COLORS = [
+        colors.HexColor("#223459"),  # Dark Navy
+        colors.HexColor("#6A5AAA"),  # Purple
+        colors.HexColor("#B45082"),  # Magenta
+        colors.HexColor("#F9767F"),  # Coral
+        colors.HexColor("#FFB142"),  # Orange
+        colors.HexColor("#10B981"),  # Emerald
+        colors.HexColor("#3B82F6"),  # Blue
+        colors.HexColor("#8B5CF6"),  # Violet
+        colors.HexColor("#EC4899"),  # Pink
+        colors.HexColor("#F59E0B"),  # Amber
+    ]
+    # Compact palette for the per-employee category bars
+    MINI_CATEGORY_COLORS = [
+        SECONDARY,
+        ACCENT,
+        colors.HexColor("#8B5CF6"),  # Violet
+        colors.HexColor("#EC4899"),  # Pink
+        colors.HexColor("#F59E0B"),  # Amber
+        colors.HexColor("#10B981"),  # Emerald
+    ]
+    
     # Spacing system (8pt grid)
     SPACE_XS = 4 * pt
     SPACE_SM = 8 * pt
@@ -339,13 +377,40 @@ def create_styles():
         alignment=TA_CENTER,
     ))
     
+    # Table header (marketplace activity tables)
+    styles.add(ParagraphStyle(
+        name='TableHeader',
+        fontName=DesignSystem.FONT_BOLD,
+        fontSize=DesignSystem.FONT_SIZE_SM,
+        textColor=DesignSystem.GRAY_600,
+        alignment=TA_CENTER,
+        spaceAfter=DesignSystem.SPACE_XS,
+    ))
+    
     return styles
 
 
+_STYLES = None
+
+
+def get_styles():
+    """Return the shared report stylesheet, building it on first use."""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = create_styles()
+    return _STYLES
+
+
 # =============================================================================
 # CUSTOM FLOWABLES
 # =============================================================================
 
+@lru_cache(maxsize=256)
+def text_width(text, font_name, font_size):
+    """Return the width of text in points, cached since labels repeat across pages."""
+    return stringWidth(text, font_name, font_size)
+
+
 class SectionDivider(Flowable):
     """A horizontal line divider between sections."""
     
@@ -392,7 +457,7 @@ class KPICard(Flowable):
         # Value
         self.canv.setFillColor(self.color)
         self.canv.setFont(DesignSystem.FONT_BOLD, DesignSystem.FONT_SIZE_2XL)
-        value_width = stringWidth(self.value, DesignSystem.FONT_BOLD, DesignSystem.FONT_SIZE_2XL)
+        value_width = text_width(self.value, DesignSystem.FONT_BOLD, DesignSystem.FONT_SIZE_2XL)
         self.canv.drawString(
             (self.card_width - value_width) / 2,
             self.card_height / 2 + 2*mm,
@@ -402,7 +467,7 @@ class KPICard(Flowable):
         # Label
         self.canv.setFillColor(DesignSystem.GRAY_500)
         self.canv.setFont(DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM)
-        label_width = stringWidth(self.label, DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM)
+        label_width = text_width(self.label, DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM)
         self.canv.drawString(
             (self.card_width - label_width) / 2,
             self.card_height / 2 - 8*mm,
@@ -435,11 +500,11 @@ class GroupHeader(Flowable):
         
         # Total changes badge
         badge_text = f"{self.total_changes} changes"
-        badge_width = stringWidth(badge_text, DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM) + 8*mm
+        badge_width = text_width(badge_text, DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM) + 8*mm
         badge_x = self.box_width - badge_width - 5*mm
         
         # Badge background (semi-transparent white)
-        self.canv.setFillColor(colors.Color(1, 1, 1, alpha=0.2))
+        self.canv.setFillColor(DesignSystem.WHITE_OVERLAY)
         self.canv.roundRect(badge_x, self.box_height/2 - 4*mm, badge_width, 8*mm, 2*mm, fill=1, stroke=0)
         
         # Badge text
@@ -474,21 +539,51 @@ class UserHeader(Flowable):
         # Total changes
         changes_text = f"{self.total_changes} total changes"
         self.canv.setFont(DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM)
-        text_width = stringWidth(changes_text, DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM)
-        self.canv.drawString(self.box_width - text_width - 5*mm, self.box_height/2 - 1.5*mm, changes_text)
+        changes_width = text_width(changes_text, DesignSystem.FONT_FAMILY, DesignSystem.FONT_SIZE_SM)
+        self.canv.drawString(self.box_width - changes_width - 5*mm, self.box_height/2 - 1.5*mm, changes_text)
 
 
 # =============================================================================
 # CHART COMPONENTS
 # =============================================================================
 
+# Shape factories for the per-bar primitives. Rect/String and the fixed style
+# values are bound as defaults so hot chart loops avoid global lookups.
+def _filled_rect(x, y, width, height, fill_color, _Rect=Rect):
+    """Create a borderless filled rectangle."""
+    return _Rect(x, y, width, height, fillColor=fill_color, strokeColor=None, strokeWidth=0)
+
+
+def _segment_rect(x, y, width, height, fill_color, stroke_color=DesignSystem.WHITE,
+                  stroke_width=0.5, _Rect=Rect):
+    """Create a stacked bar segment with a thin separating outline."""
+    return _Rect(x, y, width, height, fillColor=fill_color,
+                 strokeColor=stroke_color, strokeWidth=stroke_width)
+
+
+def _chart_label(x, y, text, fill_color, font_size=DesignSystem.FONT_SIZE_XS,
+                 anchor='middle', font_name=DesignSystem.FONT_FAMILY, _String=String):
+    """Create a chart text label."""
+    return _String(x, y, text, fontName=font_name, fontSize=font_size,
+                   textAnchor=anchor, fillColor=fill_color)
+
+
 def create_bar_chart(data_dict, title, width=220, height=180, 
                      color_map=None, show_values=True):
     """Create a clean vertical bar chart."""
     drawing = Drawing(width, height)
     
-    if not data_dict:
-        data_dict = {"No Data": 0}
+    # Nothing to draw when every value is zero
+    if not data_dict or not any(data_dict.values()):
+        drawing.add(String(
+            width / 2, height / 2,
+            "No data available",
+            fontName=DesignSystem.FONT_FAMILY,
+            fontSize=DesignSystem.FONT_SIZE_SM,
+            textAnchor='middle',
+            fillColor=DesignSystem.GRAY_400
+        ))
+        return drawing
     
     # Sort keys
     sorted_keys = sorted(data_dict.keys())
@@ -519,11 +614,19 @@ def create_bar_chart(data_dict, title, width=220, height=180,
     bar_spacing = chart_width / bar_count
     bar_width = bar_spacing * 0.7
     
+    # Loop invariants
+    bar_offset = chart_x + (bar_spacing - bar_width) / 2
+    half_bar = bar_width / 2
+    height_scale = chart_height / max_value
+    category_label_y = chart_y - 12
+    
+    # Collect shapes and add them to the drawing in one batch
+    shapes = []
     for i, key in enumerate(sorted_keys):
         value = data_dict[key]
-        bar_height = (value / max_value) * chart_height if max_value > 0 else 0
+        bar_height = value * height_scale
         
-        x = chart_x + i * bar_spacing + (bar_spacing - bar_width) / 2
+        x = bar_offset + i * bar_spacing
         y = chart_y
         
         # Get color
@@ -534,36 +637,21 @@ def create_bar_chart(data_dict, title, width=220, height=180,
         
         # Draw bar with rounded top
         if bar_height > 0:
-            drawing.add(Rect(
-                x, y, bar_width, bar_height,
-                fillColor=bar_color,
-                strokeColor=None,
-                strokeWidth=0
-            ))
+            shapes.append(_filled_rect(x, y, bar_width, bar_height, bar_color))
         
         # Value label
         if show_values and value > 0:
-            drawing.add(String(
-                x + bar_width / 2,
-                y + bar_height + 3,
-                str(value),
-                fontName=DesignSystem.FONT_FAMILY,
-                fontSize=DesignSystem.FONT_SIZE_XS,
-                textAnchor='middle',
-                fillColor=DesignSystem.GRAY_600
+            shapes.append(_chart_label(
+                x + half_bar, y + bar_height + 3, str(value), DesignSystem.GRAY_600
             ))
         
         # Category label
-        drawing.add(String(
-            x + bar_width / 2,
-            chart_y - 12,
-            str(key),
-            fontName=DesignSystem.FONT_FAMILY,
-            fontSize=DesignSystem.FONT_SIZE_XS,
-            textAnchor='middle',
-            fillColor=DesignSystem.GRAY_500
+        shapes.append(_chart_label(
+            x + half_bar, category_label_y, str(key), DesignSystem.GRAY_500
         ))
     
+    drawing.contents.extend(shapes)
+    
     # Y-axis line
     drawing.add(Line(
         chart_x - 2, chart_y,
@@ -583,8 +671,13 @@ def create_bar_chart(data_dict, title, width=220, height=180,
     return drawing
 
 
-def create_horizontal_stacked_bar(phase_user_data, title, width=480, height=160):
-    """Create a horizontal stacked bar chart showing user contributions per phase."""
+def create_horizontal_stacked_bar(phase_user_data, title, width=480, height=160,
+                                  phase_totals=None):
+    """Create a horizontal stacked bar chart showing user contributions per phase.
+    
+    phase_totals optionally maps phase -> total count (as accumulated by
+    collect_metrics) so the bar scale does not need to be re-summed.
+    """
     drawing = Drawing(width, height)
     
     if not phase_user_data:
@@ -608,18 +701,18 @@ def create_horizontal_stacked_bar(phase_user_data, title, width=480, height=160)
         fillColor=DesignSystem.GRAY_700
     ))
     
-    # Get all users and phases
+    # Get all users, phases and the largest phase total in a single pass
     phases = sorted(phase_user_data.keys(), key=lambda x: int(x) if x.isdigit() else 999)
     all_users = set()
+    max_total = max(1, *phase_totals.values()) if phase_totals else 1
     for phase_data in phase_user_data.values():
         all_users.update(phase_data.keys())
+        if not phase_totals:
+            phase_total = sum(phase_data.values())
+            if phase_total > max_total:
+                max_total = phase_total
     all_users = sorted(all_users)
-    
-    # Calculate max total
-    max_total = 1
-    for phase in phases:
-        phase_total = sum(phase_user_data.get(phase, {}).values())
-        max_total = max(max_total, phase_total)
+    user_colors = {user: DesignSystem.get_user_color(user) for user in all_users}
     
     # Chart dimensions
     chart_x = 80
@@ -628,55 +721,56 @@ def create_horizontal_stacked_bar(phase_user_data, title, width=480, height=160)
     bar_height = min(18, (height - 60) / len(phases) - 4) if phases else 18
     spacing = 4
     
-    # Draw bars
+    # Loop invariants
+    row_stride = bar_height + spacing
+    label_dy = bar_height / 2 - 3
+    width_scale = chart_width / max_total
+    
+    # Draw bars, collecting shapes to add in one batch. Segments are drawn
+    # together in stacking order, with value labels on top.
+    shapes = []
+    labels = []
+    segments = []
     for i, phase in enumerate(phases):
-        y_pos = chart_y + (bar_height + spacing) * i
+        y_pos = chart_y + row_stride * i
+        label_y = y_pos + label_dy
         
         # Phase label
         phase_label = PHASE_SHORT.get(phase, f"P{phase}")
-        drawing.add(String(
-            chart_x - 8,
-            y_pos + bar_height / 2 - 3,
-            phase_label,
-            fontName=DesignSystem.FONT_FAMILY,
-            fontSize=DesignSystem.FONT_SIZE_SM,
-            textAnchor='end',
-            fillColor=DesignSystem.GRAY_600
+        shapes.append(_chart_label(
+            chart_x - 8, label_y, phase_label, DesignSystem.GRAY_600,
+            font_size=DesignSystem.FONT_SIZE_SM, anchor='end'
         ))
         
-        # Draw stacked segments
+        # Draw stacked segments; only users active in this phase have one,
+        # and sorting them keeps the same order as all_users
         x_start = chart_x
         phase_data = phase_user_data.get(phase, {})
         
-        for user in all_users:
-            value = phase_data.get(user, 0)
+        for user in sorted(phase_data):
+            value = phase_data[user]
             if value > 0:
-                segment_width = (value / max_total) * chart_width
+                segment_width = value * width_scale
                 
-                drawing.add(Rect(
-                    x_start, y_pos,
-                    segment_width, bar_height,
-                    fillColor=DesignSystem.get_user_color(user),
-                    strokeColor=DesignSystem.WHITE,
-                    strokeWidth=0.5
+                segments.append(_segment_rect(
+                    x_start, y_pos, segment_width, bar_height, user_colors[user]
                 ))
                 
                 # Value label if wide enough
                 if segment_width > 18:
-                    drawing.add(String(
-                        x_start + segment_width / 2,
-                        y_pos + bar_height / 2 - 3,
-                        str(value),
-                        fontName=DesignSystem.FONT_FAMILY,
-                        fontSize=DesignSystem.FONT_SIZE_XS,
-                        textAnchor='middle',
-                        fillColor=DesignSystem.WHITE
+                    labels.append(_chart_label(
+                        x_start + segment_width / 2, label_y, str(value), DesignSystem.WHITE
                     ))
                 
                 x_start += segment_width
     
+    shapes.extend(segments)
+    shapes.extend(labels)
+    
+    drawing.contents.extend(shapes)
+    
     # Build legend data
-    legend_data = [(DesignSystem.get_user_color(user), user) for user in all_users]
+    legend_data = [(user_colors[user], user) for user in all_users]
     
     return drawing, legend_data
 
@@ -695,12 +789,17 @@ def create_legend_row(color_name_pairs, width=480, height=20):
     box_size = 8
     font_size = DesignSystem.FONT_SIZE_XS
     
+    # Every item sits on the same row
+    y = height / 2 - box_size / 2
+    label_y = y + 1
+    label_dx = box_size + 4
+    
+    shapes = []
     for i, (color, name) in enumerate(color_name_pairs):
         x = 10 + i * item_width
-        y = height / 2 - box_size / 2
         
         # Color box
-        drawing.add(Rect(
+        shapes.append(Rect(
             x, y, box_size, box_size,
             fillColor=color,
             strokeColor=DesignSystem.GRAY_300,
@@ -709,15 +808,30 @@ def create_legend_row(color_name_pairs, width=480, height=20):
         
         # Label
         label = name if len(name) <= 8 else name[:7] + "…"
-        drawing.add(String(
-            x + box_size + 4,
-            y + 1,
+        shapes.append(String(
+            x + label_dx,
+            label_y,
             label,
             fontName=DesignSystem.FONT_FAMILY,
             fontSize=font_size,
             fillColor=DesignSystem.GRAY_600
         ))
     
+    drawing.contents.extend(shapes)
+    return drawing
+
+
+def stack_drawings(top, bottom):
+    """Combine two drawings of equal width into one, top above bottom.
+    
+    The result is a single flowable, so the pair is wrapped and drawn in
+    one pass and can never be split across a page break.
+    """
+    drawing = Drawing(max(top.width, bottom.width), top.height + bottom.height)
+    drawing.add(Group(*bottom.contents))
+    shifted = Group(*top.contents)
+    shifted.translate(0, bottom.height)
+    drawing.add(shifted)
     return drawing
 
 
@@ -725,7 +839,8 @@ def create_donut_chart(data_dict, title, width=200, height=180, color_map=None):
     """Create a donut chart with center label."""
     drawing = Drawing(width, height)
     
-    if not data_dict or sum(data_dict.values()) == 0:
+    total = sum(data_dict.values()) if data_dict else 0
+    if total == 0:
         drawing.add(String(
             width / 2, height / 2,
             "No data",
@@ -751,35 +866,37 @@ def create_donut_chart(data_dict, title, width=200, height=180, color_map=None):
     outer_radius = min(width, height) * 0.32
     inner_radius = outer_radius * 0.55
     
-    # Calculate total and draw segments
-    total = sum(data_dict.values())
+    # Draw segments
     start_angle = 90  # Start from top
     
     sorted_items = sorted(data_dict.items(), key=lambda x: x[1], reverse=True)
     
+    # Slice styling shared by every wedge, resolved once
+    degrees_per_unit = 360 / total
+    slice_colors = color_map or {}
+    default_color = DesignSystem.PRIMARY
+    stroke_color = DesignSystem.WHITE
+    
+    wedges = []
     for key, value in sorted_items:
         if value <= 0:
             continue
         
-        angle_extent = (value / total) * 360
-        
-        # Get color
-        if color_map and key in color_map:
-            segment_color = color_map[key]
-        else:
-            segment_color = DesignSystem.PRIMARY
+        angle_extent = value * degrees_per_unit
         
         # Draw wedge
-        drawing.add(Wedge(
+        wedges.append(Wedge(
             cx, cy, outer_radius,
             start_angle - angle_extent, start_angle,
-            fillColor=segment_color,
-            strokeColor=DesignSystem.WHITE,
+            fillColor=slice_colors.get(key, default_color),
+            strokeColor=stroke_color,
             strokeWidth=2
         ))
         
         start_angle -= angle_extent
     
+    drawing.contents.extend(wedges)
+    
     # Inner circle (creates donut effect)
     drawing.add(Circle(
         cx, cy, inner_radius,
@@ -901,17 +1018,17 @@ def create_status_bar(status_values, width=450, height=60):
     bar_width = width - 40
     bar_height = 16
     
-    # Draw segments
+    # Draw segments and legend, adding all shapes in one batch
+    shapes = []
     x_start = bar_x
-    status_order = ["Aktuell", "<30", "31 - 60", ">60"]
     
-    for status in status_order:
+    for status in STATUS_ORDER:
         value = status_values.get(status, 0)
         if value > 0:
             segment_width = (value / total) * bar_width
             color = DesignSystem.STATUS_COLORS.get(status, DesignSystem.GRAY_400)
             
-            drawing.add(Rect(
+            shapes.append(Rect(
                 x_start, bar_y,
                 segment_width, bar_height,
                 fillColor=color,
@@ -921,7 +1038,7 @@ def create_status_bar(status_values, width=450, height=60):
             
             # Value label if wide enough
             if segment_width > 25:
-                drawing.add(String(
+                shapes.append(String(
                     x_start + segment_width / 2,
                     bar_y + bar_height / 2 - 3,
                     str(value),
@@ -936,22 +1053,23 @@ def create_status_bar(status_values, width=450, height=60):
     # Legend
     legend_y = 5
     legend_x = bar_x
-    for status in status_order:
+    for status in STATUS_ORDER:
         color = DesignSystem.STATUS_COLORS.get(status, DesignSystem.GRAY_400)
         value = status_values.get(status, 0)
         pct = (value / total * 100) if total > 0 else 0
         
-        drawing.add(Rect(legend_x, legend_y, 6, 6, fillColor=color, strokeColor=None))
+        shapes.append(Rect(legend_x, legend_y, 6, 6, fillColor=color, strokeColor=None))
         label = f"{status}: {pct:.0f}%"
-        drawing.add(String(
+        shapes.append(String(
             legend_x + 9, legend_y,
             label,
             fontName=DesignSystem.FONT_FAMILY,
             fontSize=7,
             fillColor=DesignSystem.GRAY_600
         ))
-        legend_x += stringWidth(label, DesignSystem.FONT_FAMILY, 7) + 20
+        legend_x += text_width(label, DesignSystem.FONT_FAMILY, 7) + 20
     
+    drawing.contents.extend(shapes)
     return drawing
 
 
@@ -969,7 +1087,20 @@ def parse_date(date_str):
     if isinstance(date_str, datetime):
         return date_str.date()
     
-    cleaned = str(date_str).strip()
+    return _parse_date_text(str(date_str))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text):
+    """Parse a date string, cached since the same dates recur across rows."""
+    cleaned = text.strip()
+    # Fast path for plain YYYY-MM-DD, the form Smartsheet and the tracker use
+    if len(cleaned) == 10 and cleaned[4] == '-' and cleaned[7] == '-':
+        try:
+            return date.fromisoformat(cleaned)
+        except ValueError:
+            pass
+    
     if cleaned and not cleaned[-1].isdigit():
         cleaned = cleaned.rstrip('abcdefghijklmnopqrstuvwxyz')
     
@@ -987,28 +1118,54 @@ def parse_date(date_str):
 
 def load_changes(start_date=None, end_date=None):
     """Load changes from CSV file within date range."""
-    if not os.path.exists(CHANGES_FILE):
-        logger.error(f"Changes file not found: {CHANGES_FILE}")
-        return []
-    
     changes = []
+    filter_range = bool(start_date and end_date)
+    if filter_range:
+        # Timestamps are written as "%Y-%m-%d %H:%M:%S", so the date prefix
+        # compares correctly as a string; rows outside the range are
+        # rejected before any datetime parsing.
+        start_str = start_date.isoformat()
+        end_str = end_date.isoformat()
     try:
-        with open(CHANGES_FILE, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(CHANGES_FILE, 'r', newline='', encoding='utf-8',
+                  buffering=CSV_READ_BUFFER_SIZE) as f:
+            # Plain rows indexed by position; dicts are only built for kept rows
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return changes
+            ts_idx = header.index('Timestamp')
+            
+            # Bind the per-row callables once rather than looking them up per row
+            parse_timestamp = datetime.fromisoformat
+            parse_iso_date = date.fromisoformat
+            append_change = changes.append
+            
             for row in reader:
+                if not row:
+                    continue
                 try:
-                    ts = datetime.strptime(row['Timestamp'], "%Y-%m-%d %H:%M:%S").date()
+                    timestamp = row[ts_idx]
+                    if filter_range and not (start_str <= timestamp[:10] <= end_str):
+                        continue
                     
-                    if start_date and end_date:
-                        if start_date <= ts <= end_date:
-                            row['ParsedDate'] = parse_date(row.get('Date'))
-                            changes.append(row)
-                    else:
-                        row['ParsedDate'] = parse_date(row.get('Date'))
-                        changes.append(row)
-                except (ValueError, KeyError) as e:
+                    # Validate the timestamp only for rows that are kept; the
+                    # tracker writes ISO values, which the C-level
+                    # fromisoformat parsers handle without strptime
+                    parse_timestamp(timestamp)
+                    change = dict(zip(header, row))
+                    date_str = change.get('Date')
+                    try:
+                        change['ParsedDate'] = parse_iso_date(date_str)
+                    except (ValueError, TypeError):
+                        change['ParsedDate'] = parse_date(date_str)
+                    append_change(change)
+                except (ValueError, IndexError, TypeError) as e:
                     logger.warning(f"Error parsing row: {e}")
                     continue
+    except FileNotFoundError:
+        logger.error(f"Changes file not found: {CHANGES_FILE}")
+        return changes
     except Exception as e:
         logger.error(f"Error reading changes file: {e}")
     
@@ -1023,13 +1180,24 @@ def collect_metrics(changes):
         "groups": defaultdict(int),
         "phases": defaultdict(int),
         "users": defaultdict(int),
-        "group_phase_user": defaultdict(lambda: defaultdict(lambda: defaultdict(int))),
+        "group_phase_user": {},
+        "group_phase_totals": {},
+        "user_group_phase": {},
         "marketplaces": defaultdict(int),
     }
     
     if not changes:
         return metrics
     
+    # Bind the accumulators once rather than looking them up per change
+    group_counts = metrics["groups"]
+    phase_counts = metrics["phases"]
+    user_counts_total = metrics["users"]
+    marketplace_counts = metrics["marketplaces"]
+    group_phase_user = metrics["group_phase_user"]
+    group_phase_totals = metrics["group_phase_totals"]
+    user_group_phase = metrics["user_group_phase"]
+    
     for change in changes:
         group = change.get('Group', '')
         phase = change.get('Phase', '')
@@ -1037,26 +1205,42 @@ def collect_metrics(changes):
         marketplace = change.get('Marketplace', '')
         
         if group:
-            metrics["groups"][group] += 1
+            group_counts[group] += 1
         if phase:
-            metrics["phases"][phase] += 1
+            phase_counts[phase] += 1
         if user:
-            metrics["users"][user] += 1
+            user_counts_total[user] += 1
         if marketplace:
-            metrics["marketplaces"][marketplace] += 1
+            marketplace_counts[marketplace] += 1
         
         if group and phase and user:
-            metrics["group_phase_user"][group][phase][user] += 1
+            # Plain dicts so later reads never insert empty (phase, user) entries
+            user_counts = group_phase_user.setdefault(group, {}).setdefault(phase, {})
+            user_counts[user] = user_counts.get(user, 0) + 1
+            phase_totals = group_phase_totals.setdefault(group, {})
+            phase_totals[phase] = phase_totals.get(phase, 0) + 1
+            # Same counts keyed by user first, for the employee pages
+            group_phases = user_group_phase.setdefault(user, {}).setdefault(group, {})
+            group_phases[phase] = group_phases.get(phase, 0) + 1
     
     return metrics
 
 
+def get_client():
+    """Create a Smartsheet client, importing the SDK on first use."""
+    global smartsheet
+    if smartsheet is None:
+        import smartsheet as sdk
+        smartsheet = sdk
+    return smartsheet.Smartsheet(token)
+
+
 def get_sheet_summary_data(sheet_id):
     """Fetch sheet summary fields."""
     if not SMARTSHEET_AVAILABLE or not token:
         return None
     try:
-        client = smartsheet.Smartsheet(token)
+        client = get_client()
         summary = client.Sheets.get_sheet_summary(sheet_id)
         return {field.title: field.display_value for field in summary.fields}
     except Exception as e:
@@ -1069,63 +1253,132 @@ def get_column_map(sheet_id):
     if not SMARTSHEET_AVAILABLE or not token:
         return None
     try:
-        client = smartsheet.Smartsheet(token)
-        sheet = client.Sheets.get_sheet(sheet_id, include=['columns'])
-        return {col.title: col.id for col in sheet.columns}
+        client = get_client()
+        # Column definitions only, without downloading the sheet's rows
+        columns = client.Sheets.get_columns(sheet_id, include_all=True).data
+        return {col.title: col.id for col in columns}
     except Exception as e:
         logger.error(f"Error getting column map: {e}")
         return None
 
 
-def query_smartsheet_data(group=None):
-    """Query Smartsheet for activity metrics."""
-    if not SMARTSHEET_AVAILABLE or not token:
-        return {"total_items": 0, "recent_activity_items": 0, "recent_percentage": 0}
+def get_sheet_cached(client, sheet_id, column_ids=None):
+    """Fetch a sheet, reusing an on-disk copy while its version is unchanged.
     
-    client = smartsheet.Smartsheet(token)
+    Smartsheet bumps a sheet's version on every edit, so a cheap version
+    probe decides whether the cached rows are still current. A copy
+    confirmed within the last SHEET_CACHE_TTL seconds (and on the same day)
+    is used without probing at all, and without any copy the sheet is
+    fetched straight away since the probe could only miss.
     
-    total_items = 0
-    recent_activity_items = 0
-    thirty_days_ago = datetime.now() - timedelta(days=30)
+    The cache directory is not persisted between workflow runs, so this
+    only saves API calls on local reruns.
+    """
+    if column_ids:
+        cols_key = hashlib.md5(",".join(map(str, sorted(column_ids))).encode()).hexdigest()[:12]
+    else:
+        cols_key = "all"
+    prefix = f"sheet_{sheet_id}_{cols_key}_"
     
-    sheet_ids = {group: SHEET_IDS[group]} if group and group in SHEET_IDS else SHEET_IDS
+    has_copy = False
+    try:
+        now = datetime.now()
+        for name in os.listdir(SHEET_CACHE_DIR):
+            if name.startswith(prefix) and name.endswith(".pkl"):
+                has_copy = True
+                path = os.path.join(SHEET_CACHE_DIR, name)
+                confirmed = datetime.fromtimestamp(os.path.getmtime(path))
+                if confirmed.date() == now.date() and \
+                        (now - confirmed).total_seconds() < SHEET_CACHE_TTL:
+                    with open(path, 'rb') as f:
+                        return smartsheet.models.Sheet(pickle.load(f))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable sheet cache for sheet {sheet_id}: {e}")
     
-    for sheet_group, sheet_id in sheet_ids.items():
-        if sheet_group == "SPECIAL":
-            continue
+    if has_copy:
+        try:
+            version = client.Sheets.get_sheet_version(sheet_id).version
+        except Exception as e:
+            logger.warning(f"Could not get version of sheet {sheet_id}: {e}")
+            version = None
+        
+        if version is None:
+            return client.Sheets.get_sheet(sheet_id, column_ids=column_ids)
+        
+        cache_file = os.path.join(SHEET_CACHE_DIR, f"{prefix}{version}.pkl")
         
         try:
-            sheet = client.Sheets.get_sheet(sheet_id)
-            
-            phase_cols = {}
-            for col in sheet.columns:
-                if col.title in ["Kontrolle", "BE am", "K am", "C am", "Reopen C2 am"]:
-                    phase_cols[col.title] = col.id
-            
-            for row in sheet.rows:
-                total_items += 1
-                most_recent = None
-                
-                for col_title, col_id in phase_cols.items():
-                    for cell in row.cells:
-                        if cell.column_id == col_id and cell.value:
-                            try:
-                                date_val = parse_date(cell.value)
-                                if date_val and (most_recent is None or date_val > most_recent):
-                                    most_recent = date_val
-                            except:
-                                pass
-                
-                if most_recent and most_recent >= thirty_days_ago.date():
-                    recent_activity_items += 1
+            with open(cache_file, 'rb') as f:
+                sheet = smartsheet.models.Sheet(pickle.load(f))
+            # Version confirmed current; restart the TTL window
+            os.utime(cache_file)
+            return sheet
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.error(f"Error processing sheet {sheet_group}: {e}")
+            logger.warning(f"Ignoring unreadable sheet cache {cache_file}: {e}")
     
-    return {
-        "total_items": total_items,
-        "recent_activity_items": recent_activity_items,
-        "recent_percentage": (recent_activity_items / total_items * 100) if total_items > 0 else 0
-    }
+    sheet = client.Sheets.get_sheet(sheet_id, column_ids=column_ids)
+    if isinstance(sheet, smartsheet.models.Error) or sheet.version is None:
+        return sheet
+    
+    # Name the copy by the version the sheet was downloaded at
+    cache_file = os.path.join(SHEET_CACHE_DIR, f"{prefix}{sheet.version}.pkl")
+    try:
+        os.makedirs(SHEET_CACHE_DIR, exist_ok=True)
+        # Drop copies of older versions of the same sheet/columns
+        for name in os.listdir(SHEET_CACHE_DIR):
+            if name.startswith(prefix):
+                os.remove(os.path.join(SHEET_CACHE_DIR, name))
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(sheet.to_dict(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.warning(f"Could not cache sheet {sheet_id}: {e}")
+    
+    return sheet
+
+
+# Columns of the special activities sheet, in (user, date, category, duration) order
+SPECIAL_ACTIVITY_COLUMNS = ("Mitarbeiter", "Datum", "Kategorie", "Arbeitszeit in Std")
+
+
+def get_special_activities_sheet(client, sheet_id):
+    """Fetch the special activities sheet restricted to the columns it is read for.
+    
+    Returns (sheet, column_ids) with column_ids ordered as
+    SPECIAL_ACTIVITY_COLUMNS, or (None, None) if any column is missing.
+    """
+    columns = client.Sheets.get_columns(sheet_id, include_all=True).data
+    col_map = {col.title: col.id for col in columns}
+    column_ids = [col_map.get(title) for title in SPECIAL_ACTIVITY_COLUMNS]
+    if not all(column_ids):
+        return None, None
+    return get_sheet_cached(client, sheet_id, column_ids=column_ids), column_ids
+
+
+def parse_activity_date(date_str):
+    """Parse a special activity date in the formats Smartsheet returns."""
+    if 'T' in date_str:
+        # ISO format: 2025-02-05T00:00:00Z or 2025-02-05T00:00:00
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
+    return datetime.strptime(date_str[:10], '%Y-%m-%d').date()
+
+
+def activity_date_in_range(date_str, start_iso, end_iso, start_date, end_date):
+    """Check whether a special activity date string falls within the range.
+    
+    ISO dates compare correctly as strings, so the many rows outside the
+    range are rejected without parsing; the rest are still parsed, which
+    keeps invalid dates excluded as before.
+    """
+    if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+        if not (start_iso <= date_str[:10] <= end_iso):
+            return False
+    return start_date <= parse_activity_date(date_str) <= end_date
 
 
 def get_special_activities(start_date, end_date):
@@ -1138,41 +1391,33 @@ def get_special_activities(start_date, end_date):
         return {}, 0, 0
     
     try:
-        client = smartsheet.Smartsheet(token)
-        sheet = client.Sheets.get_sheet(sheet_id)
-        
-        col_map = {col.title: col.id for col in sheet.columns}
-        user_col_id = col_map.get("Mitarbeiter")
-        date_col_id = col_map.get("Datum")
-        category_col_id = col_map.get("Kategorie")
-        duration_col_id = col_map.get("Arbeitszeit in Std")
-        
-        if not all([user_col_id, date_col_id, category_col_id, duration_col_id]):
+        client = get_client()
+        sheet, column_ids = get_special_activities_sheet(client, sheet_id)
+        if sheet is None:
             return {}, 0, 0
+        user_col_id, date_col_id, category_col_id, duration_col_id = column_ids
         
         user_activity = {}
         total_activities = 0
         total_hours = 0
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
         
         for row in sheet.rows:
-            date_cell = row.get_column(date_col_id)
+            # Index the row's cells once instead of a linear get_column() per field
+            cells = {cell.column_id: cell for cell in row.cells}
+            date_cell = cells.get(date_col_id)
             if date_cell and date_cell.value:
                 try:
-                    # Handle multiple date formats from Smartsheet
                     date_str = str(date_cell.value)
-                    if 'T' in date_str:
-                        # ISO format: 2025-02-05T00:00:00Z or 2025-02-05T00:00:00
-                        activity_date = datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
-                    else:
-                        activity_date = datetime.strptime(date_str[:10], '%Y-%m-%d').date()
-                    if start_date <= activity_date <= end_date:
-                        user = row.get_column(user_col_id)
+                    if activity_date_in_range(date_str, start_iso, end_iso, start_date, end_date):
+                        user = cells.get(user_col_id)
                         user = user.value if user else "Unassigned"
                         
-                        category = row.get_column(category_col_id)
+                        category = cells.get(category_col_id)
                         category = category.value if category else "Uncategorized"
                         
-                        duration_cell = row.get_column(duration_col_id)
+                        duration_cell = cells.get(duration_col_id)
                         duration = 0
                         if duration_cell and duration_cell.value:
                             try:
@@ -1180,13 +1425,14 @@ def get_special_activities(start_date, end_date):
                             except:
                                 pass
                         
-                        if user not in user_activity:
-                            user_activity[user] = {"count": 0, "hours": 0, "categories": {}}
+                        activity = user_activity.get(user)
+                        if activity is None:
+                            activity = user_activity[user] = {"count": 0, "hours": 0, "categories": {}}
                         
-                        user_activity[user]["count"] += 1
-                        user_activity[user]["hours"] += duration
-                        user_activity[user]["categories"][category] = \
-                            user_activity[user]["categories"].get(category, 0) + duration
+                        activity["count"] += 1
+                        activity["hours"] += duration
+                        categories = activity["categories"]
+                        categories[category] = categories.get(category, 0) + duration
                         
                         total_activities += 1
                         total_hours += duration
@@ -1205,21 +1451,40 @@ def get_marketplace_activity(group_name, sheet_id, start_date, end_date):
         return [], []
     
     try:
-        client = smartsheet.Smartsheet(token)
-        sheet = client.Sheets.get_sheet(sheet_id)
+        client = get_client()
         
-        col_map = {col.title: col.id for col in sheet.columns}
+        # Resolve the needed columns first so only those cells are downloaded
+        columns = client.Sheets.get_columns(sheet_id, include_all=True).data
+        col_map = {col.title: col.id for col in columns}
         marketplace_col_id = col_map.get("Amazon")
         date_cols = {t: i for t, i in col_map.items() if " am" in t or "Kontrolle" in t}
         
         if not marketplace_col_id or not date_cols:
             return [], []
         
-        product_last_activity = {}
+        sheet = get_sheet_cached(
+            client, sheet_id, column_ids=[marketplace_col_id, *date_cols.values()]
+        )
+        
+        # Latest phase date per row that has a marketplace
+        date_col_ids = set(date_cols.values())
+        # Running [total days since last activity, row count] per marketplace
+        marketplace_days = {}
+        today = datetime.now().date()
+        
         for row in sheet.rows:
+            cells = row.cells
+            # Rows without a marketplace never count, so skip their date parsing
+            mp_value = None
+            for cell in cells:
+                if cell.column_id == marketplace_col_id:
+                    mp_value = cell.value
+                    break
+            if not mp_value:
+                continue
             last_date = None
-            for cell in row.cells:
-                if cell.column_id in date_cols.values():
+            for cell in cells:
+                if cell.column_id in date_col_ids:
                     try:
                         cell_date = parse_date(cell.value)
                         if cell_date and (last_date is None or cell_date > last_date):
@@ -1227,24 +1492,20 @@ def get_marketplace_activity(group_name, sheet_id, start_date, end_date):
                     except:
                         continue
             if last_date:
-                product_last_activity[row.id] = last_date
-        
-        marketplace_data = defaultdict(lambda: {"count": 0, "days": []})
-        today = datetime.now().date()
-        
-        for row in sheet.rows:
-            if row.id in product_last_activity:
-                mp_cell = row.get_column(marketplace_col_id)
-                if mp_cell and mp_cell.value:
-                    mp = mp_cell.value.strip().upper()
-                    marketplace_data[mp]["count"] += 1
-                    marketplace_data[mp]["days"].append((today - product_last_activity[row.id]).days)
+                mp = mp_value.strip().upper()
+                age = (today - last_date).days
+                totals = marketplace_days.get(mp)
+                if totals is None:
+                    marketplace_days[mp] = [age, 1]
+                else:
+                    totals[0] += age
+                    totals[1] += 1
         
         # Calculate averages and format
-        combined = []
-        for mp, data in marketplace_data.items():
-            avg_days = sum(data["days"]) / len(data["days"]) if data["days"] else 0
-            combined.append((mp, avg_days, data["count"]))
+        combined = [
+            (mp, total_days / count, count)
+            for mp, (total_days, count) in marketplace_days.items()
+        ]
         
         most_active = sorted(combined, key=lambda x: x[1])[:5]
         most_inactive = sorted(combined, key=lambda x: x[1], reverse=True)[:5]
@@ -1304,19 +1565,44 @@ def create_summary_table(metrics, styles):
     return table
 
 
+# Marketplace ranking table styles, shared by both tables on every group page
+EMPTY_ACTIVITY_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, -1), DesignSystem.FONT_FAMILY),
+    ('FONTSIZE', (0, 0), (-1, -1), DesignSystem.FONT_SIZE_SM),
+    ('TEXTCOLOR', (0, 0), (-1, -1), DesignSystem.GRAY_400),
+    ('BACKGROUND', (0, 0), (-1, -1), DesignSystem.GRAY_50),
+    ('PADDING', (0, 0), (-1, -1), 10),
+])
+ACTIVITY_TABLE_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0, 0), (-1, 0), DesignSystem.GRAY_100),
+    ('TEXTCOLOR', (0, 0), (-1, 0), DesignSystem.GRAY_700),
+    ('FONTNAME', (0, 0), (-1, 0), DesignSystem.FONT_BOLD),
+    ('FONTSIZE', (0, 0), (-1, 0), DesignSystem.FONT_SIZE_XS),
+    ('ALIGN', (0, 0), (-1, 0), 'LEFT'),
+    
+    # Data
+    ('FONTNAME', (0, 1), (-1, -1), DesignSystem.FONT_FAMILY),
+    ('FONTSIZE', (0, 1), (-1, -1), DesignSystem.FONT_SIZE_XS),
+    ('TEXTCOLOR', (0, 1), (-1, -1), DesignSystem.GRAY_600),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    
+    # Grid
+    ('LINEBELOW', (0, 0), (-1, -1), 0.5, DesignSystem.GRAY_200),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+])
+
+
 def create_activity_table(activity_data, title):
     """Create a marketplace activity table."""
     if not activity_data:
         data = [[f"No {title.lower()} data"]]
         table = Table(data, colWidths=[70*mm])
-        table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), DesignSystem.FONT_FAMILY),
-            ('FONTSIZE', (0, 0), (-1, -1), DesignSystem.FONT_SIZE_SM),
-            ('TEXTCOLOR', (0, 0), (-1, -1), DesignSystem.GRAY_400),
-            ('BACKGROUND', (0, 0), (-1, -1), DesignSystem.GRAY_50),
-            ('PADDING', (0, 0), (-1, -1), 10),
-        ]))
+        table.setStyle(EMPTY_ACTIVITY_TABLE_STYLE)
         return table
     
     data = [["Market", "Avg Days", "Count"]]
@@ -1324,27 +1610,7 @@ def create_activity_table(activity_data, title):
         data.append([market, f"{avg_days:.1f}", str(count)])
     
     table = Table(data, colWidths=[30*mm, 22*mm, 18*mm])
-    table.setStyle(TableStyle([
-        # Header
-        ('BACKGROUND', (0, 0), (-1, 0), DesignSystem.GRAY_100),
-        ('TEXTCOLOR', (0, 0), (-1, 0), DesignSystem.GRAY_700),
-        ('FONTNAME', (0, 0), (-1, 0), DesignSystem.FONT_BOLD),
-        ('FONTSIZE', (0, 0), (-1, 0), DesignSystem.FONT_SIZE_XS),
-        ('ALIGN', (0, 0), (-1, 0), 'LEFT'),
-        
-        # Data
-        ('FONTNAME', (0, 1), (-1, -1), DesignSystem.FONT_FAMILY),
-        ('FONTSIZE', (0, 1), (-1, -1), DesignSystem.FONT_SIZE_XS),
-        ('TEXTCOLOR', (0, 1), (-1, -1), DesignSystem.GRAY_600),
-        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-        
-        # Grid
-        ('LINEBELOW', (0, 0), (-1, -1), 0.5, DesignSystem.GRAY_200),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    table.setStyle(ACTIVITY_TABLE_STYLE)
     
     return table
 
@@ -1467,6 +1733,11 @@ def build_overview_charts(story, styles, metrics, content_width):
     """Build the overview charts section with user summary - all on first page."""
     story.append(Paragraph("Activity Overview", styles['SectionHeader']))
     
+    # Skip chart and summary layout entirely for an empty period
+    if not metrics["total_changes"]:
+        story.append(Paragraph("No changes recorded in this period.", styles['ReportBody']))
+        return
+    
     # Create smaller charts to fit on first page
     chart_width = (content_width - 10*mm) / 2
     chart_height = 130  # Reduced from 160
@@ -1568,8 +1839,49 @@ def build_overview_charts(story, styles, metrics, content_width):
         story.append(user_table)
 
 
-def build_group_detail_page(story, styles, group, group_data, metrics, content_width, start_date, end_date):
-    """Build a detailed page for a specific group."""
+def prefetch_group_data(groups, start_date, end_date):
+    """Fetch sheet summaries and marketplace activity for all groups concurrently.
+    
+    Returns {group: (summary_data, (most_active, most_inactive))}. Empty when
+    the API is not available, in which case pages fetch (and skip) on their own.
+    """
+    if not SMARTSHEET_AVAILABLE or not token:
+        return {}
+    
+    groups = [g for g in groups if SHEET_IDS.get(g)]
+    if not groups:
+        return {}
+    
+    def fetch(group):
+        sheet_id = SHEET_IDS[group]
+        return (
+            get_sheet_summary_data(sheet_id),
+            get_marketplace_activity(group, sheet_id, start_date, end_date),
+        )
+    
+    # Each request is network-bound, so the sheets are fetched in parallel
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        return dict(zip(groups, executor.map(fetch, groups)))
+
+
+# Group detail page layout, shared by every group page
+GROUP_CHART_HEIGHT = 140
+GROUP_LEGEND_HEIGHT = 18
+GROUP_STATUS_BAR_HEIGHT = 55
+MARKETPLACE_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2*mm),
+])
+
+
+def build_group_detail_page(story, styles, group, group_data, metrics, content_width, start_date, end_date,
+                            prefetched=None):
+    """Build a detailed page for a specific group.
+    
+    prefetched is this group's entry from prefetch_group_data, if available.
+    """
     story.append(PageBreak())
     
     # Group header
@@ -1586,27 +1898,28 @@ def build_group_detail_page(story, styles, group, group_data, metrics, content_w
             phase_user_data,
             "",
             width=content_width,
-            height=140
+            height=GROUP_CHART_HEIGHT,
+            phase_totals=metrics["group_phase_totals"].get(group)
         )
-        story.append(chart)
-        
         if legend_data:
-            legend = create_legend_row(legend_data, width=content_width, height=18)
-            story.append(legend)
+            legend = create_legend_row(legend_data, width=content_width, height=GROUP_LEGEND_HEIGHT)
+            chart = stack_drawings(chart, legend)
+        story.append(chart)
         
         story.append(Spacer(1, DesignSystem.SPACE_MD))
     
+    sheet_id = SHEET_IDS.get(group)
+    
     # Try to get sheet summary data for status breakdown
     try:
-        sheet_id = SHEET_IDS.get(group)
         if sheet_id:
-            summary_data = get_sheet_summary_data(sheet_id)
+            summary_data = prefetched[0] if prefetched else get_sheet_summary_data(sheet_id)
             if summary_data:
                 story.append(Paragraph("Product Status", styles['SubsectionHeader']))
                 
                 # Extract status values
                 status_values = {}
-                for cat in ["Aktuell", "<30", "31 - 60", ">60"]:
+                for cat in STATUS_ORDER:
                     try:
                         val = summary_data.get(cat, '0') or '0'
                         status_values[cat] = int(str(val).replace('.', ''))
@@ -1614,7 +1927,7 @@ def build_group_detail_page(story, styles, group, group_data, metrics, content_w
                         status_values[cat] = 0
                 
                 if sum(status_values.values()) > 0:
-                    status_bar = create_status_bar(status_values, width=content_width, height=55)
+                    status_bar = create_status_bar(status_values, width=content_width, height=GROUP_STATUS_BAR_HEIGHT)
                     story.append(status_bar)
                     story.append(Spacer(1, DesignSystem.SPACE_MD))
     except Exception as e:
@@ -1622,9 +1935,11 @@ def build_group_detail_page(story, styles, group, group_data, metrics, content_w
     
     # Marketplace activity
     try:
-        sheet_id = SHEET_IDS.get(group)
         if sheet_id:
-            most_active, most_inactive = get_marketplace_activity(group, sheet_id, start_date, end_date)
+            if prefetched:
+                most_active, most_inactive = prefetched[1]
+            else:
+                most_active, most_inactive = get_marketplace_activity(group, sheet_id, start_date, end_date)
             
             if most_active or most_inactive:
                 story.append(Paragraph("Marketplace Activity", styles['SubsectionHeader']))
@@ -1632,27 +1947,16 @@ def build_group_detail_page(story, styles, group, group_data, metrics, content_w
                 active_table = create_activity_table(most_active, "Most Active")
                 inactive_table = create_activity_table(most_inactive, "Least Active")
                 
-                # Headers and tables
-                header_style = ParagraphStyle(
-                    'TableHeader',
-                    fontName=DesignSystem.FONT_BOLD,
-                    fontSize=DesignSystem.FONT_SIZE_SM,
-                    textColor=DesignSystem.GRAY_600,
-                    alignment=TA_CENTER,
-                    spaceAfter=DesignSystem.SPACE_XS,
-                )
+                # Headers and tables, side by side in two equal columns
+                header_style = styles['TableHeader']
+                column_width = content_width / 2 - 5*mm
                 
                 mp_table = Table([
                     [Paragraph("Most Active", header_style), Paragraph("Least Active", header_style)],
                     [active_table, inactive_table]
-                ], colWidths=[content_width/2 - 5*mm, content_width/2 - 5*mm])
+                ], colWidths=[column_width, column_width])
                 
-                mp_table.setStyle(TableStyle([
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 2*mm),
-                ]))
+                mp_table.setStyle(MARKETPLACE_TABLE_STYLE)
                 
                 story.append(mp_table)
     except Exception as e:
@@ -1702,43 +2006,37 @@ def create_user_activity_by_group_chart(user_group_data, user_name, width=480, h
     bar_height = min(16, (height - 50) / len(sorted_groups) - 4) if sorted_groups else 16
     spacing = 4
     
+    # Loop invariants
+    row_stride = bar_height + spacing
+    last_row = len(sorted_groups) - 1
+    label_dy = bar_height / 2 - 3
+    width_scale = chart_width / max_value if max_value > 0 else 0
+    
+    shapes = []
     for i, (group, count) in enumerate(sorted_groups):
-        y_pos = chart_y + (bar_height + spacing) * (len(sorted_groups) - 1 - i)
+        y_pos = chart_y + row_stride * (last_row - i)
+        label_y = y_pos + label_dy
         
         # Group label
-        drawing.add(String(
-            chart_x - 8,
-            y_pos + bar_height / 2 - 3,
-            group,
-            fontName=DesignSystem.FONT_FAMILY,
-            fontSize=DesignSystem.FONT_SIZE_SM,
-            textAnchor='end',
-            fillColor=DesignSystem.GRAY_600
+        shapes.append(_chart_label(
+            chart_x - 8, label_y, group, DesignSystem.GRAY_600,
+            font_size=DesignSystem.FONT_SIZE_SM, anchor='end'
         ))
         
         # Bar
-        bar_width = (count / max_value) * chart_width if max_value > 0 else 0
+        bar_width = count * width_scale
         color = DesignSystem.GROUP_COLORS.get(group, DesignSystem.PRIMARY)
         
         if bar_width > 0:
-            drawing.add(Rect(
-                chart_x, y_pos,
-                bar_width, bar_height,
-                fillColor=color,
-                strokeColor=None
-            ))
+            shapes.append(_filled_rect(chart_x, y_pos, bar_width, bar_height, color))
         
         # Value label
-        drawing.add(String(
-            chart_x + bar_width + 5,
-            y_pos + bar_height / 2 - 3,
-            str(count),
-            fontName=DesignSystem.FONT_BOLD,
-            fontSize=DesignSystem.FONT_SIZE_XS,
-            textAnchor='start',
-            fillColor=DesignSystem.GRAY_600
+        shapes.append(_chart_label(
+            chart_x + bar_width + 5, label_y, str(count), DesignSystem.GRAY_600,
+            anchor='start', font_name=DesignSystem.FONT_BOLD
         ))
     
+    drawing.contents.extend(shapes)
     return drawing
 
 
@@ -1803,23 +2101,23 @@ def create_special_activities_mini_chart(category_hours, total_hours, width=250,
     spacing = 3
     
     # Colors for categories
-    cat_colors = [
-        DesignSystem.SECONDARY,
-        DesignSystem.ACCENT,
-        colors.HexColor("#8B5CF6"),
-        colors.HexColor("#EC4899"),
-        colors.HexColor("#F59E0B"),
-        colors.HexColor("#10B981"),
-    ]
+    cat_colors = DesignSystem.MINI_CATEGORY_COLORS
     
+    # Loop invariants
+    row_stride = bar_height + spacing
+    last_row = len(sorted_cats) - 1
+    label_dy = bar_height / 2 - 3
+    
+    shapes = []
     for i, (cat, hours) in enumerate(sorted_cats):
-        y_pos = chart_y + (bar_height + spacing) * (len(sorted_cats) - 1 - i)
+        y_pos = chart_y + row_stride * (last_row - i)
+        label_y = y_pos + label_dy
         
         # Category label (truncated)
         label = cat if len(cat) <= 10 else cat[:8] + "…"
-        drawing.add(String(
+        shapes.append(String(
             chart_x - 5,
-            y_pos + bar_height / 2 - 3,
+            label_y,
             label,
             fontName=DesignSystem.FONT_FAMILY,
             fontSize=7,
@@ -1832,7 +2130,7 @@ def create_special_activities_mini_chart(category_hours, total_hours, width=250,
         color = cat_colors[i % len(cat_colors)]
         
         if bar_width > 0:
-            drawing.add(Rect(
+            shapes.append(Rect(
                 chart_x, y_pos,
                 bar_width, bar_height,
                 fillColor=color,
@@ -1840,9 +2138,9 @@ def create_special_activities_mini_chart(category_hours, total_hours, width=250,
             ))
         
         # Hours label
-        drawing.add(String(
+        shapes.append(String(
             chart_x + bar_width + 4,
-            y_pos + bar_height / 2 - 3,
+            label_y,
             f"{hours:.1f}h",
             fontName=DesignSystem.FONT_FAMILY,
             fontSize=7,
@@ -1850,6 +2148,7 @@ def create_special_activities_mini_chart(category_hours, total_hours, width=250,
             fillColor=DesignSystem.GRAY_600
         ))
     
+    drawing.contents.extend(shapes)
     return drawing
 
 
@@ -1859,17 +2158,21 @@ def collect_user_activity_data(metrics, user):
         "total_changes": metrics["users"].get(user, 0),
         "groups": defaultdict(int),
         "phases": defaultdict(int),
-        "group_phase": defaultdict(lambda: defaultdict(int)),
+        "group_phase": {},
+        "group_phase_total": 0,
     }
     
-    # Collect from group_phase_user structure
-    for group, phase_data in metrics["group_phase_user"].items():
-        for phase, user_counts in phase_data.items():
-            if user in user_counts:
-                count = user_counts[user]
-                user_data["groups"][group] += count
-                user_data["phases"][phase] += count
-                user_data["group_phase"][group][phase] = count
+    # Collect from the per-user pivot built in collect_metrics
+    group_totals = user_data["groups"]
+    phase_totals = user_data["phases"]
+    grand_total = 0
+    for group, phase_counts in metrics["user_group_phase"].get(user, {}).items():
+        user_data["group_phase"][group] = dict(phase_counts)
+        for phase, count in phase_counts.items():
+            group_totals[group] += count
+            phase_totals[phase] += count
+            grand_total += count
+    user_data["group_phase_total"] = grand_total
     
     return user_data
 
@@ -1881,39 +2184,32 @@ def get_user_special_activities_data(user_name, start_date, end_date):
         return {}, 0, 0
     
     try:
-        client = smartsheet.Smartsheet(token)
-        sheet = client.Sheets.get_sheet(sheet_id)
-        
-        col_map = {col.title: col.id for col in sheet.columns}
-        user_col_id = col_map.get("Mitarbeiter")
-        date_col_id = col_map.get("Datum")
-        category_col_id = col_map.get("Kategorie")
-        duration_col_id = col_map.get("Arbeitszeit in Std")
-        
-        if not all([user_col_id, date_col_id, category_col_id, duration_col_id]):
+        client = get_client()
+        sheet, column_ids = get_special_activities_sheet(client, sheet_id)
+        if sheet is None:
             return {}, 0, 0
+        user_col_id, date_col_id, category_col_id, duration_col_id = column_ids
         
         category_hours = defaultdict(float)
         total_count = 0
         total_hours = 0
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
         
         for row in sheet.rows:
+            cells = {cell.column_id: cell for cell in row.cells}
+            
             # Check user
-            user_cell = row.get_column(user_col_id)
+            user_cell = cells.get(user_col_id)
             if not user_cell or user_cell.value != user_name:
                 continue
             
             # Check date
-            date_cell = row.get_column(date_col_id)
+            date_cell = cells.get(date_col_id)
             if date_cell and date_cell.value:
                 try:
-                    # Handle multiple date formats from Smartsheet
                     date_str = str(date_cell.value)
-                    if 'T' in date_str:
-                        activity_date = datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
-                    else:
-                        activity_date = datetime.strptime(date_str[:10], '%Y-%m-%d').date()
-                    if not (start_date <= activity_date <= end_date):
+                    if not activity_date_in_range(date_str, start_iso, end_iso, start_date, end_date):
                         continue
                 except:
                     continue
@@ -1921,10 +2217,10 @@ def get_user_special_activities_data(user_name, start_date, end_date):
                 continue
             
             # Get category and duration
-            category_cell = row.get_column(category_col_id)
+            category_cell = cells.get(category_col_id)
             category = category_cell.value if category_cell and category_cell.value else "Other"
             
-            duration_cell = row.get_column(duration_col_id)
+            duration_cell = cells.get(duration_col_id)
             duration = 0
             if duration_cell and duration_cell.value:
                 try:
@@ -1963,6 +2259,24 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
     ))
     story.append(Spacer(1, DesignSystem.SPACE_MD))
     
+    # Layout values shared by every employee page
+    team_total = sum(active_users.values())
+    card_width = (content_width - 10*mm) / 4
+    card_height = 35*mm
+    card_table_style = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 1*mm),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 1*mm),
+    ])
+    group_chart_width = content_width * 0.6
+    phase_chart_width = content_width * 0.38
+    charts_col_widths = [content_width * 0.6, content_width * 0.4]
+    charts_table_style = TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ])
+    
     for idx, (user, total_changes) in enumerate(sorted_users):
         # Page break between users (not before first)
         if idx > 0:
@@ -1976,8 +2290,9 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
         user_activity = collect_user_activity_data(metrics, user)
         
         # Get special activities for this user
-        if special_activities_data and user in special_activities_data:
-            user_special = special_activities_data[user]
+        if special_activities_data is not None:
+            # Already fetched for the whole team; users missing from it had none
+            user_special = special_activities_data.get(user, {})
             special_categories = user_special.get("categories", {})
             special_count = user_special.get("count", 0)
             special_hours = user_special.get("hours", 0)
@@ -1988,48 +2303,41 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
             )
         
         # === ROW 1: KPI Cards ===
-        card_width = (content_width - 10*mm) / 4
-        
-        total_share = (total_changes / sum(active_users.values()) * 100) if sum(active_users.values()) > 0 else 0
+        total_share = (total_changes / team_total * 100) if team_total > 0 else 0
         
         cards = [
             KPICard(
                 total_changes,
                 "Product Changes",
                 width=card_width,
-                height=35*mm,
+                height=card_height,
                 color=DesignSystem.get_user_color(user)
             ),
             KPICard(
                 f"{total_share:.1f}%",
                 "Team Share",
                 width=card_width,
-                height=35*mm,
+                height=card_height,
                 color=DesignSystem.SECONDARY
             ),
             KPICard(
                 special_count if special_count > 0 else "—",
                 "Special Activities",
                 width=card_width,
-                height=35*mm,
+                height=card_height,
                 color=DesignSystem.ACCENT
             ),
             KPICard(
                 f"{special_hours:.1f}h" if special_hours > 0 else "—",
                 "Special Hours",
                 width=card_width,
-                height=35*mm,
-                color=colors.HexColor("#8B5CF6")
+                height=card_height,
+                color=DesignSystem.SPECIAL
             ),
         ]
         
         card_table = Table([cards], colWidths=[card_width] * 4)
-        card_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 1*mm),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 1*mm),
-        ]))
+        card_table.setStyle(card_table_style)
         story.append(card_table)
         story.append(Spacer(1, DesignSystem.SPACE_MD))
         
@@ -2040,25 +2348,22 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
         group_chart = create_user_activity_by_group_chart(
             dict(user_activity["groups"]),
             user,
-            width=content_width * 0.6,
+            width=group_chart_width,
             height=120
         )
         
         # Phase breakdown chart
         phase_chart = create_user_phase_breakdown_chart(
             dict(user_activity["phases"]),
-            width=content_width * 0.38,
+            width=phase_chart_width,
             height=120
         )
         
         charts_table = Table(
             [[group_chart, phase_chart]],
-            colWidths=[content_width * 0.6, content_width * 0.4]
+            colWidths=charts_col_widths
         )
-        charts_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ]))
+        charts_table.setStyle(charts_table_style)
         story.append(charts_table)
         story.append(Spacer(1, DesignSystem.SPACE_MD))
         
@@ -2067,10 +2372,11 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
         if user_activity["group_phase"]:
             story.append(Paragraph("Activity by Group and Phase", styles['SubsectionHeader']))
             
-            # Build table data
-            phases = sorted(set(
-                p for gp in user_activity["group_phase"].values() for p in gp.keys()
-            ), key=lambda x: int(x) if x.isdigit() else 999)
+            # Build table data; row and column totals come straight from the
+            # per-group and per-phase sums collected with the user's pivot
+            group_totals = user_activity["groups"]
+            phase_totals = user_activity["phases"]
+            phases = sorted(phase_totals, key=lambda x: int(x) if x.isdigit() else 999)
             
             groups = sorted(user_activity["group_phase"].keys())
             
@@ -2081,22 +2387,16 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
             # Data rows
             for group in groups:
                 row = [group]
-                group_total = 0
+                group_counts = user_activity["group_phase"][group]
                 for phase in phases:
-                    val = user_activity["group_phase"][group].get(phase, 0)
+                    val = group_counts.get(phase, 0)
                     row.append(str(val) if val > 0 else "—")
-                    group_total += val
-                row.append(str(group_total))
+                row.append(str(group_totals[group]))
                 table_data.append(row)
             
             # Total row
-            total_row = ["Total"]
-            grand_total = 0
-            for phase in phases:
-                phase_total = sum(user_activity["group_phase"][g].get(phase, 0) for g in groups)
-                total_row.append(str(phase_total))
-                grand_total += phase_total
-            total_row.append(str(grand_total))
+            total_row = ["Total"] + [str(phase_totals[phase]) for phase in phases]
+            total_row.append(str(user_activity["group_phase_total"]))
             table_data.append(total_row)
             
             # Calculate column widths
@@ -2213,9 +2513,16 @@ def build_employee_detail_pages(story, styles, metrics, content_width, start_dat
             ))
 
 
-def build_special_activities_page(story, styles, start_date, end_date, content_width):
-    """Build the special activities page."""
-    user_activity, total_activities, total_hours = get_special_activities(start_date, end_date)
+def build_special_activities_page(story, styles, start_date, end_date, content_width,
+                                  special_activities=None):
+    """Build the special activities page.
+    
+    special_activities is the (user_activity, total_activities, total_hours)
+    tuple from get_special_activities; it is fetched if not provided.
+    """
+    if special_activities is None:
+        special_activities = get_special_activities(start_date, end_date)
+    user_activity, total_activities, total_hours = special_activities
     
     if not user_activity:
         return
@@ -2265,18 +2572,7 @@ def build_special_activities_page(story, styles, start_date, end_date, content_w
 
     if category_hours:
         # Define colors for categories
-        category_colors = [
-            colors.HexColor("#223459"),  # Dark Navy
-            colors.HexColor("#6A5AAA"),  # Purple
-            colors.HexColor("#B45082"),  # Magenta
-            colors.HexColor("#F9767F"),  # Coral
-            colors.HexColor("#FFB142"),  # Orange
-            colors.HexColor("#10B981"),  # Emerald
-            colors.HexColor("#3B82F6"),  # Blue
-            colors.HexColor("#8B5CF6"),  # Violet
-            colors.HexColor("#EC4899"),  # Pink
-            colors.HexColor("#F59E0B"),  # Amber
-        ]
+        category_colors = DesignSystem.CATEGORY_COLORS
 
         # Sort categories by hours
         sorted_cats = sorted(category_hours.items(), key=lambda x: x[1], reverse=True)[:10]
@@ -2455,12 +2751,33 @@ def build_special_activities_page(story, styles, start_date, end_date, content_w
 # MAIN REPORT FUNCTIONS
 # =============================================================================
 
-def create_weekly_report(start_date, end_date, force=False):
-    """Create a weekly PDF report."""
+def is_report_up_to_date(filename):
+    """Check whether an existing report is newer than the change history.
+    
+    Only the change history is considered: the sections sourced live from
+    Smartsheet (status summaries, marketplace and special activities) and
+    changes to this code can still make such a report stale.
+    """
+    try:
+        return os.stat(filename).st_mtime >= os.stat(CHANGES_FILE).st_mtime
+    except OSError:
+        return False
+
+
+def create_weekly_report(start_date, end_date, force=False, reuse_existing=False):
+    """Create a weekly PDF report.
+    
+    With reuse_existing, a report newer than the change history is
+    returned as-is instead of being rebuilt.
+    """
     week_str = f"{start_date.isocalendar()[0]}-W{start_date.isocalendar()[1]:02d}"
-    out_dir = os.path.join(REPORTS_DIR, "weekly")
-    os.makedirs(out_dir, exist_ok=True)
-    filename = os.path.join(out_dir, f"weekly_report_{week_str}.pdf")
+    os.makedirs(WEEKLY_REPORTS_DIR, exist_ok=True)
+    filename = WEEKLY_REPORT_FILE.format(week_str)
+    
+    if reuse_existing and is_report_up_to_date(filename):
+        logger.info(f"Reusing existing weekly report for {week_str}, newer than the change history "
+                    f"(Smartsheet-sourced sections not refreshed): {filename}")
+        return filename
     
     logger.info(f"Creating weekly report for {week_str}")
     
@@ -2472,7 +2789,7 @@ def create_weekly_report(start_date, end_date, force=False):
         return None
     
     metrics = collect_metrics(changes)
-    styles = create_styles()
+    styles = get_styles()
     
     # Calculate content width
     page_width, page_height = A4
@@ -2501,28 +2818,34 @@ def create_weekly_report(start_date, end_date, force=False):
     # Overview charts
     build_overview_charts(story, styles, metrics, content_width)
     
-    # Group detail pages
-    for group in sorted(metrics["group_phase_user"].keys()):
-        if group:
-            build_group_detail_page(
-                story, styles, group, 
-                metrics["group_phase_user"][group],
-                metrics, content_width,
-                start_date, end_date
-            )
+    # Group detail pages (API data for all groups fetched up front)
+    groups = [g for g in sorted(metrics["group_phase_user"].keys()) if g]
+    group_api_data = prefetch_group_data(groups, start_date, end_date)
+    for group in groups:
+        build_group_detail_page(
+            story, styles, group,
+            metrics["group_phase_user"][group],
+            metrics, content_width,
+            start_date, end_date,
+            group_api_data.get(group)
+        )
     
     # User summary page
     build_user_summary_page(story, styles, metrics, content_width)
     
+    # Fetch special activities once for the employee pages and the summary page
+    special_activities = get_special_activities(start_date, end_date)
+    
     # Employee detail pages (individual breakdown for each user)
-    special_activities_data, _, _ = get_special_activities(start_date, end_date)
     build_employee_detail_pages(
         story, styles, metrics, content_width,
-        start_date, end_date, special_activities_data
+        start_date, end_date, special_activities[0]
     )
     
     # Special activities summary page (team overview)
-    build_special_activities_page(story, styles, start_date, end_date, content_width)
+    build_special_activities_page(
+        story, styles, start_date, end_date, content_width, special_activities
+    )
     
     # Build PDF with header/footer
     def add_page_elements(canvas, doc):
@@ -2549,17 +2872,23 @@ def create_weekly_report(start_date, end_date, force=False):
     return filename
 
 
-def create_monthly_report(year, month, force=False):
-    """Create a monthly PDF report."""
-    from calendar import monthrange
+def create_monthly_report(year, month, force=False, reuse_existing=False):
+    """Create a monthly PDF report.
     
+    With reuse_existing, a report newer than the change history is
+    returned as-is instead of being rebuilt.
+    """
     start_date = date(year, month, 1)
     end_date = date(year, month, monthrange(year, month)[1])
     
     month_str = f"{year}-{month:02d}"
-    out_dir = os.path.join(REPORTS_DIR, "monthly")
-    os.makedirs(out_dir, exist_ok=True)
-    filename = os.path.join(out_dir, f"monthly_report_{month_str}.pdf")
+    os.makedirs(MONTHLY_REPORTS_DIR, exist_ok=True)
+    filename = MONTHLY_REPORT_FILE.format(month_str)
+    
+    if reuse_existing and is_report_up_to_date(filename):
+        logger.info(f"Reusing existing monthly report for {month_str}, newer than the change history "
+                    f"(Smartsheet-sourced sections not refreshed): {filename}")
+        return filename
     
     logger.info(f"Creating monthly report for {month_str}")
     
@@ -2571,7 +2900,7 @@ def create_monthly_report(year, month, force=False):
         return None
     
     metrics = collect_metrics(changes)
-    styles = create_styles()
+    styles = get_styles()
     
     # Calculate content width
     page_width, page_height = A4
@@ -2600,28 +2929,34 @@ def create_monthly_report(year, month, force=False):
     # Overview charts
     build_overview_charts(story, styles, metrics, content_width)
     
-    # Group detail pages
-    for group in sorted(metrics["group_phase_user"].keys()):
-        if group:
-            build_group_detail_page(
-                story, styles, group,
-                metrics["group_phase_user"][group],
-                metrics, content_width,
-                start_date, end_date
-            )
+    # Group detail pages (API data for all groups fetched up front)
+    groups = [g for g in sorted(metrics["group_phase_user"].keys()) if g]
+    group_api_data = prefetch_group_data(groups, start_date, end_date)
+    for group in groups:
+        build_group_detail_page(
+            story, styles, group,
+            metrics["group_phase_user"][group],
+            metrics, content_width,
+            start_date, end_date,
+            group_api_data.get(group)
+        )
     
     # User summary page
     build_user_summary_page(story, styles, metrics, content_width)
     
+    # Fetch special activities once for the employee pages and the summary page
+    special_activities = get_special_activities(start_date, end_date)
+    
     # Employee detail pages (individual breakdown for each user)
-    special_activities_data, _, _ = get_special_activities(start_date, end_date)
     build_employee_detail_pages(
         story, styles, metrics, content_width,
-        start_date, end_date, special_activities_data
+        start_date, end_date, special_activities[0]
     )
     
     # Special activities summary page (team overview)
-    build_special_activities_page(story, styles, start_date, end_date, content_width)
+    build_special_activities_page(
+        story, styles, start_date, end_date, content_width, special_activities
+    )
     
     # Build PDF with header/footer
     def add_page_elements(canvas, doc):
@@ -2666,7 +3001,7 @@ def upload_pdf_to_smartsheet(file_path, row_id):
         return
     
     try:
-        client = smartsheet.Smartsheet(token)
+        client = get_client()
         client.Attachments.attach_file_to_row(
             REPORT_METADATA_SHEET_ID,
             row_id,
@@ -2686,7 +3021,7 @@ def update_smartsheet_cells(sheet_id, row_id, column_map, filename, date_range_s
         return
     
     try:
-        client = smartsheet.Smartsheet(token)
+        client = get_client()
         
         primary_col = column_map.get("Primäre Spalte")
         secondary_col = column_map.get("Spalte2")
@@ -2759,6 +3094,9 @@ if __name__ == "__main__":
     parser.add_argument("--previous", action="store_true", help="Generate report for previous period")
     parser.add_argument("--current", action="store_true", help="Generate report for current period")
     parser.add_argument("--force", action="store_true", help="Force report generation")
+    parser.add_argument("--reuse-existing", action="store_true",
+                        help="Return an existing report if it is newer than the change history "
+                             "(ignores Smartsheet-sourced sections)")
     
     args = parser.parse_args()
     
@@ -2766,14 +3104,14 @@ if __name__ == "__main__":
         if args.weekly:
             if args.previous:
                 start_date, end_date = get_previous_week()
-                filename = create_weekly_report(start_date, end_date, force=args.force)
+                filename = create_weekly_report(start_date, end_date, force=args.force, reuse_existing=args.reuse_existing)
             elif args.current:
                 start_date, end_date = get_current_week()
-                filename = create_weekly_report(start_date, end_date, force=args.force)
+                filename = create_weekly_report(start_date, end_date, force=args.force, reuse_existing=args.reuse_existing)
             elif args.year and args.week:
                 start_date = datetime.fromisocalendar(args.year, args.week, 1).date()
                 end_date = start_date + timedelta(days=6)
-                filename = create_weekly_report(start_date, end_date, force=args.force)
+                filename = create_weekly_report(start_date, end_date, force=args.force, reuse_existing=args.reuse_existing)
             else:
                 logger.error("Specify --previous, --current, or --year and --week")
                 exit(1)
@@ -2781,12 +3119,12 @@ if __name__ == "__main__":
         elif args.monthly:
             if args.previous:
                 year, month = get_previous_month()
-                filename = create_monthly_report(year, month, force=args.force)
+                filename = create_monthly_report(year, month, force=args.force, reuse_existing=args.reuse_existing)
             elif args.current:
                 year, month = get_current_month()
-                filename = create_monthly_report(year, month, force=args.force)
+                filename = create_monthly_report(year, month, force=args.force, reuse_existing=args.reuse_existing)
             elif args.year and args.month:
-                filename = create_monthly_report(args.year, args.month, force=args.force)
+                filename = create_monthly_report(args.year, args.month, force=args.force, reuse_existing=args.reuse_existing)
             else:
                 logger.error("Specify --previous, --current, or --year and --month")
                 exit(1)
@@ -33,13 +33,16 @@ from config import (
     DAILY_STATS_SHEET_ID,
     DATA_DIR,
     CHANGES_FILE,
+    CSV_READ_BUFFER_SIZE,
     STATE_FILE,
+    PHASE_NAMES,
     USERS,
     SHEET_IDS,
     TIMESTAMP_FORMAT,
     API_MAX_RETRIES,
     API_RETRY_DELAY,
     API_RETRY_MAX_DELAY,
+    API_PAGE_SIZE,
     get_product_groups,
 )
 
@@ -154,9 +157,45 @@ def get_client() -> Optional[smartsheet.Smartsheet]:
         f"(attempt {retry_state.attempt_number}/{API_MAX_RETRIES})"
     )
 )
-def get_sheet_with_retry(client: smartsheet.Smartsheet, sheet_id: int):
-    """Fetch a sheet from Smartsheet with automatic retry on failure."""
-    return client.Sheets.get_sheet(sheet_id)
+def get_sheet_with_retry(client: smartsheet.Smartsheet, sheet_id: int, **kwargs):
+    """Fetch a sheet from Smartsheet with automatic retry on failure.
+    
+    Extra keyword arguments (column_ids, page_size, page) are passed to get_sheet.
+    """
+    return client.Sheets.get_sheet(sheet_id, **kwargs)
+
+
+def iter_sheet_rows(client, sheet_id, column_ids=None):
+    """Yield a sheet's rows one page at a time.
+    
+    Only the given columns are requested, and no further pages are
+    fetched once the caller stops iterating. Paging stops at the sheet's
+    total row count, since Smartsheet returns the last page again for a
+    page number past the end.
+    """
+    page = 1
+    while True:
+        sheet = get_sheet_with_retry(
+            client, sheet_id, column_ids=column_ids, page_size=API_PAGE_SIZE, page=page
+        )
+        rows = sheet.rows
+        yield from rows
+        total_rows = sheet.total_row_count
+        if len(rows) < API_PAGE_SIZE or total_rows is None or page * API_PAGE_SIZE >= total_rows:
+            return
+        page += 1
+
+
+def find_row_id(client, sheet_id, column_id, value):
+    """Return the ID of the first row whose cell in column_id equals value.
+    
+    Rows are added at the top, so recent entries are found on the first page.
+    """
+    for row in iter_sheet_rows(client, sheet_id, column_ids=[column_id]):
+        for cell in row.cells:
+            if cell.column_id == column_id and cell.value == value:
+                return row.id
+    return None
 
 
 def create_sheet(client, name, columns):
@@ -191,10 +230,14 @@ def create_sheet(client, name, columns):
 
 
 def get_column_map(client, sheet_id):
-    """Get mapping of column titles to IDs."""
+    """Get mapping of column titles to IDs.
+    
+    Only the column definitions are requested; downloading the sheet would
+    transfer every row just to read the header.
+    """
     try:
-        sheet = client.Sheets.get_sheet(sheet_id)
-        return {col.title: col.id for col in sheet.columns}
+        columns = client.Sheets.get_columns(sheet_id, include_all=True).data
+        return {col.title: col.id for col in columns}
     except Exception as e:
         logger.error(f"Failed to get column map: {e}")
         return {}
@@ -283,21 +326,33 @@ def load_changes(start_date, end_date):
     """Load changes from CSV within date range."""
     changes = []
     
-    if not os.path.exists(CHANGES_FILE):
-        return changes
-    
     try:
-        with open(CHANGES_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(CHANGES_FILE, 'r', newline='', encoding='utf-8',
+                  buffering=CSV_READ_BUFFER_SIZE) as f:
+            # Plain rows indexed by position; dicts are only built for kept rows
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header or 'Date' not in header:
+                return changes
+            date_idx = header.index('Date')
+            
+            # Dates are written as YYYY-MM-DD, so out-of-range rows are
+            # rejected by string comparison before any parsing
+            start_str = start_date.isoformat()
+            end_str = end_date.isoformat()
+            
             for row in reader:
                 try:
-                    # Parse the date from the Date field
-                    change_date = datetime.strptime(row['Date'], '%Y-%m-%d').date()
-                    if start_date <= change_date <= end_date:
-                        row['ParsedDate'] = change_date
-                        changes.append(row)
-                except (ValueError, KeyError):
+                    date_str = row[date_idx]
+                    if not (start_str <= date_str <= end_str):
+                        continue
+                    change = dict(zip(header, row))
+                    change['ParsedDate'] = date.fromisoformat(date_str)
+                    changes.append(change)
+                except (ValueError, IndexError):
                     continue
+    except FileNotFoundError:
+        return changes
     except Exception as e:
         logger.error(f"Error loading changes: {e}")
     
@@ -312,21 +367,26 @@ def calculate_weekly_stats(start_date, end_date):
         "total_changes": len(changes),
         "users": defaultdict(int),
         "groups": defaultdict(int),
-        "phases": defaultdict(int),
     }
     
+    # Count raw phase numbers in a dict pre-sized with the known phases;
+    # the "Phase N" labels are built once per phase afterwards
+    phase_counts = dict.fromkeys(PHASE_NAMES, 0)
+    
+    # Values are written pre-trimmed by the tracker, so no per-row strip()
     for change in changes:
-        user = change.get('User', '').strip()
-        group = change.get('Group', '').strip()
-        phase = change.get('Phase', '').strip()
+        user = change.get('User', '')
+        group = change.get('Group', '')
+        phase = change.get('Phase', '')
         
         if user:
             stats["users"][user] += 1
         if group:
             stats["groups"][group] += 1
         if phase:
-            stats["phases"][f"Phase {phase}"] += 1
+            phase_counts[phase] = phase_counts.get(phase, 0) + 1
     
+    stats["phases"] = {f"Phase {phase}": count for phase, count in phase_counts.items() if count}
     stats["active_users"] = len(stats["users"])
     stats["active_groups"] = len(stats["groups"])
     
@@ -370,18 +430,13 @@ def push_weekly_stats(year=None, week=None):
             return False
         
         # Check if row for this week already exists
-        sheet = client.Sheets.get_sheet(int(WEEKLY_STATS_SHEET_ID))
         week_col_id = col_map.get("Week")
         existing_row_id = None
         
         if week_col_id:
-            for row in sheet.rows:
-                for cell in row.cells:
-                    if cell.column_id == week_col_id and cell.value == week_str:
-                        existing_row_id = row.id
-                        break
-                if existing_row_id:
-                    break
+            existing_row_id = find_row_id(
+                client, int(WEEKLY_STATS_SHEET_ID), week_col_id, week_str
+            )
         
         # Build cells
         cells = [
@@ -459,7 +514,6 @@ def mark_report_generated(year, week):
     
     try:
         col_map = get_column_map(client, int(WEEKLY_STATS_SHEET_ID))
-        sheet = client.Sheets.get_sheet(int(WEEKLY_STATS_SHEET_ID))
         
         week_col_id = col_map.get("Week")
         report_col_id = col_map.get("Report Generated")
@@ -468,20 +522,19 @@ def mark_report_generated(year, week):
             return False
         
         # Find the row for this week
-        for row in sheet.rows:
-            for cell in row.cells:
-                if cell.column_id == week_col_id and cell.value == week_str:
-                    # Update the Report Generated checkbox
-                    update_row = smartsheet.models.Row()
-                    update_row.id = row.id
-                    update_row.cells = [{"column_id": report_col_id, "value": True}]
-                    
-                    client.Sheets.update_rows(int(WEEKLY_STATS_SHEET_ID), [update_row])
-                    logger.info(f"Marked report as generated for {week_str}")
-                    return True
-        
-        logger.warning(f"No row found for {week_str}")
-        return False
+        row_id = find_row_id(client, int(WEEKLY_STATS_SHEET_ID), week_col_id, week_str)
+        if row_id is None:
+            logger.warning(f"No row found for {week_str}")
+            return False
+        
+        # Update the Report Generated checkbox
+        update_row = smartsheet.models.Row()
+        update_row.id = row_id
+        update_row.cells = [{"column_id": report_col_id, "value": True}]
+        
+        client.Sheets.update_rows(int(WEEKLY_STATS_SHEET_ID), [update_row])
+        logger.info(f"Marked report as generated for {week_str}")
+        return True
         
     except Exception as e:
         logger.error(f"Failed to mark report generated: {e}")
@@ -501,28 +554,37 @@ def setup_daily_sheet():
     return sheet_id
 
 
-def calculate_daily_stats(target_date):
-    """Calculate statistics for a single day."""
-    changes = load_changes(target_date, target_date)
-    
-    stats = {
-        "date": target_date,
-        "day": target_date.strftime("%a"),  # Mon, Tue, etc.
-        "total": len(changes),
-        "users": defaultdict(int),
-        "groups": defaultdict(int),
-    }
+def calculate_daily_stats_range(start_date, end_date):
+    """Calculate per-day statistics for a date range with a single CSV scan.
+    
+    Returns one stats dict per day, ordered from start_date to end_date.
+    """
+    num_days = (end_date - start_date).days + 1
+    daily_stats = []
+    for offset in range(num_days):
+        day = start_date + timedelta(days=offset)
+        daily_stats.append({
+            "date": day,
+            "day": day.strftime("%a"),  # Mon, Tue, etc.
+            "total": 0,
+            "users": defaultdict(int),
+            "groups": defaultdict(int),
+        })
     
-    for change in changes:
-        user = change.get('User', '').strip()
-        group = change.get('Group', '').strip()
+    # Bucket each change by its day offset into the pre-sized list
+    for change in load_changes(start_date, end_date):
+        stats = daily_stats[(change['ParsedDate'] - start_date).days]
+        stats["total"] += 1
+        
+        user = change.get('User', '')
+        group = change.get('Group', '')
         
         if user:
             stats["users"][user] += 1
         if group:
             stats["groups"][group] += 1
     
-    return stats
+    return daily_stats
 
 
 def push_daily_stats(days=14):
@@ -541,29 +603,27 @@ def push_daily_stats(days=14):
             return False
         
         # Get existing rows to check for duplicates
-        sheet = client.Sheets.get_sheet(int(DAILY_STATS_SHEET_ID))
         date_col_id = col_map.get("Date")
         
         existing_dates = set()
         existing_rows = {}  # date_str -> row_id
         if date_col_id:
-            for row in sheet.rows:
+            for row in iter_sheet_rows(client, int(DAILY_STATS_SHEET_ID), column_ids=[date_col_id]):
                 for cell in row.cells:
                     if cell.column_id == date_col_id and cell.value:
                         date_str = str(cell.value)[:10]  # Get YYYY-MM-DD part
                         existing_dates.add(date_str)
                         existing_rows[date_str] = row.id
         
-        # Calculate stats for each day
+        # Calculate stats for all days with one pass over the change history
         today = date.today()
+        daily_stats = calculate_daily_stats_range(today - timedelta(days=days - 1), today)
         rows_to_add = []
         rows_to_update = []
         
         for i in range(days):
-            target_date = today - timedelta(days=i)
-            date_str = target_date.isoformat()
-            
-            stats = calculate_daily_stats(target_date)
+            stats = daily_stats[days - 1 - i]
+            date_str = stats["date"].isoformat()
             
             # Build cells
             cells = [
@@ -646,8 +706,16 @@ def get_tracking_summary():
     # Count changes
     if os.path.exists(CHANGES_FILE):
         try:
-            with open(CHANGES_FILE, 'r', encoding='utf-8') as f:
-                summary["total_changes_recorded"] = sum(1 for _ in f) - 1  # Subtract header
+            # Count newlines over raw byte chunks instead of decoding lines
+            line_count = 0
+            last_chunk = b""
+            with open(CHANGES_FILE, 'rb') as f:
+                for chunk in iter(lambda: f.read(CSV_READ_BUFFER_SIZE), b""):
+                    line_count += chunk.count(b"\n")
+                    last_chunk = chunk
+            if last_chunk and not last_chunk.endswith(b"\n"):
+                line_count += 1  # Final line without a trailing newline
+            summary["total_changes_recorded"] = line_count - 1  # Subtract header
         except:
             pass
     
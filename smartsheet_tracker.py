@@ -1,8 +1,11 @@
 import os
 import csv
 import json
+import random
 from datetime import datetime, timedelta, date
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 import smartsheet
@@ -66,7 +69,8 @@ def save_state(state):
     """Save current state to file."""
     try:
         with open(STATE_FILE, 'w') as f:
-            json.dump(state, f)
+            # json.dumps uses the C encoder; json.dump streams through the pure-Python one
+            f.write(json.dumps(state))
             logger.info(f"Saved state with {len(state.get('processed', {}))} processed items")
     except Exception as e:
         logger.error(f"Error saving state: {e}")
@@ -95,7 +99,19 @@ def parse_date(value) -> Optional[date]:
         return value
 
     # Fall back to string parsing
-    cleaned = str(value).strip()
+    return _parse_date_text(str(value))
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> Optional[date]:
+    """Parse a date string; cached since the same dates recur across rows and sheets."""
+    cleaned = text.strip()
+
+    # Fast path for plain YYYY-MM-DD, the form Smartsheet and the state file use
+    if len(cleaned) == 10 and cleaned[4] == '-' and cleaned[7] == '-':
+        try:
+            return date.fromisoformat(cleaned)
+        except ValueError:
+            pass
 
     # Clean up common trailing characters (e.g., accidental suffixes)
     if cleaned and not cleaned[-1].isdigit():
@@ -150,6 +166,20 @@ def fetch_sheet_with_retry(client: smartsheet.Smartsheet, sheet_id: int):
     return client.Sheets.get_sheet(sheet_id)
 
 
+def fetch_all_sheets(client: smartsheet.Smartsheet) -> Dict[str, Any]:
+    """Download every tracked sheet concurrently.
+
+    Returns {group: future}; each future's result() is the sheet, or raises
+    the error left once fetch_sheet_with_retry has given up.
+    """
+    # Sheet downloads are network-bound, so they all run at once
+    with ThreadPoolExecutor(max_workers=max(1, len(SHEET_IDS))) as executor:
+        return {
+            group: executor.submit(fetch_sheet_with_retry, client, sheet_id)
+            for group, sheet_id in SHEET_IDS.items()
+        }
+
+
 def get_smartsheet_client() -> Optional[smartsheet.Smartsheet]:
     """Create and return a Smartsheet client, or None if connection fails."""
     try:
@@ -186,17 +216,20 @@ def track_changes() -> bool:
         logger.info("TEST MODE: Will detect at least one change")
         if processed:
             # Remove one random key from processed
-            import random
             key_to_remove = random.choice(list(processed.keys()))
             logger.info(f"Removing key {key_to_remove} for test")
             processed.pop(key_to_remove, None)
 
-    # Current timestamp
+    # Current timestamp, formatted once for every row written in this run
     now = datetime.now()
+    timestamp = now.strftime(TIMESTAMP_FORMAT)
 
     # Track new changes
     changes_found = 0
 
+    # Sheets are downloaded together, then processed one by one in the usual order
+    sheet_futures = fetch_all_sheets(client)
+
     # Open file in append mode
     with open(CHANGES_FILE, 'a', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
@@ -206,49 +239,49 @@ def track_changes() -> bool:
             logger.info(f"Processing sheet {group} (ID: {sheet_id})")
 
             try:
-                # Get sheet with columns and rows (with retry)
-                sheet = fetch_sheet_with_retry(client, sheet_id)
+                # Get sheet with columns and rows (fetched with retry above)
+                sheet = sheet_futures[group].result()
                 logger.info(f"Sheet {group} has {len(sheet.rows)} rows")
 
                 # Map column titles to IDs
                 col_map = {col.title: col.id for col in sheet.columns}
                 amazon_col_id = col_map.get("Amazon")
 
-                # Check which phase fields exist in this sheet
-                found_fields = [date_col for date_col, user_col, _ in PHASE_FIELDS if date_col in col_map and user_col in col_map]
+                # Resolve the phase fields present in this sheet to column IDs once
+                phase_cols = [
+                    (date_col, col_map[date_col], col_map[user_col], phase_no)
+                    for date_col, user_col, phase_no in PHASE_FIELDS
+                    if date_col in col_map and user_col in col_map
+                ]
+                found_fields = [date_col for date_col, _, _, _ in phase_cols]
                 logger.info(f"Found {len(found_fields)} phase fields in {group}: {found_fields}")
 
+                # Column IDs this loop reads, so each row's cells are scanned once
+                tracked_col_ids = {amazon_col_id} if amazon_col_id else set()
+                for _, date_col_id, user_col_id, _ in phase_cols:
+                    tracked_col_ids.add(date_col_id)
+                    tracked_col_ids.add(user_col_id)
+
                 # Process each row
                 for row in sheet.rows:
-                    # Get marketplace if available
-                    marketplace = ""
-                    if amazon_col_id:
-                        for cell in row.cells:
-                            if cell.column_id == amazon_col_id:
-                                marketplace = (cell.display_value or "").strip()
-                                break
-
-                    # Check each phase field
-                    for date_col, user_col, phase_no in PHASE_FIELDS:
-                        if date_col not in col_map or user_col not in col_map:
-                            continue
+                    cells = {
+                        cell.column_id: cell
+                        for cell in row.cells
+                        if cell.column_id in tracked_col_ids
+                    }
 
-                        date_cell = None
-                        user_cell = None
+                    # Marketplace is read on the row's first change only
+                    marketplace = None
 
-                        # Get date and user values
-                        for cell in row.cells:
-                            if cell.column_id == col_map[date_col]:
-                                date_cell = cell
-                            if cell.column_id == col_map[user_col]:
-                                user_cell = cell
+                    # Check each phase field
+                    for date_col, date_col_id, user_col_id, phase_no in phase_cols:
+                        date_cell = cells.get(date_col_id)
 
                         # Skip if no date value
                         if not date_cell or not date_cell.value:
                             continue
 
                         date_val = date_cell.value
-                        user_val = user_cell.display_value if user_cell else ""
 
                         # Create unique key for this field
                         field_key = f"{group}:{row.id}:{date_col}"
@@ -273,9 +306,19 @@ def track_changes() -> bool:
                             logger.warning(f"Could not parse date: {date_val} for {field_key}")
                             continue
 
+                        # Display values are only needed for recorded changes;
+                        # trimmed here so CSV readers can skip a per-row strip()
+                        user_cell = cells.get(user_col_id)
+                        user_display = user_cell.display_value if user_cell else None
+                        user_val = user_display.strip() if user_display else ""
+                        if marketplace is None:
+                            amazon_cell = cells.get(amazon_col_id)
+                            amazon_display = amazon_cell.display_value if amazon_cell else None
+                            marketplace = amazon_display.strip() if amazon_display else ""
+
                         # Record the change
                         writer.writerow([
-                            now.strftime("%Y-%m-%d %H:%M:%S"),
+                            timestamp,
                             group,
                             row.id,
                             phase_no,
@@ -295,7 +338,7 @@ def track_changes() -> bool:
                 continue
 
     # Update state
-    state["last_run"] = now.strftime("%Y-%m-%d %H:%M:%S")
+    state["last_run"] = timestamp
     save_state(state)
 
     logger.info(f"Change tracking completed. Found {changes_found} changes.")
@@ -312,32 +355,34 @@ def reset_tracking_state() -> bool:
 
     state = {"last_run": datetime.now().strftime(TIMESTAMP_FORMAT), "processed": {}}
 
+    sheet_futures = fetch_all_sheets(client)
+
     # Process each sheet to build state
-    for group, sid in SHEET_IDS.items():
+    for group in SHEET_IDS:
         logger.info(f"Processing sheet {group}...")
         try:
-            sheet = fetch_sheet_with_retry(client, sid)
+            sheet = sheet_futures[group].result()
         except Exception as e:
             logger.error(f"Failed to fetch sheet {group} after retries: {e}")
             continue
 
         # Map column titles to IDs
         col_map = {col.title: col.id for col in sheet.columns}
+        date_cols = [
+            (date_col, col_map[date_col])
+            for date_col, _, _ in PHASE_FIELDS
+            if col_map.get(date_col)
+        ]
 
         # Process each row
         for row in sheet.rows:
-            for date_col, _, _ in PHASE_FIELDS:
-                col_id = col_map.get(date_col)
-                if not col_id:
-                    continue
-
-                # Find cell with this column ID
-                for cell in row.cells:
-                    if cell.column_id == col_id and cell.value:
-                        # Add to processed state with normalized date
-                        field_key = f"{group}:{row.id}:{date_col}"
-                        state["processed"][field_key] = normalize_date_for_comparison(cell.value)
-                        break
+            cells = {cell.column_id: cell for cell in row.cells}
+            for date_col, col_id in date_cols:
+                cell = cells.get(col_id)
+                if cell and cell.value:
+                    # Add to processed state with normalized date
+                    field_key = f"{group}:{row.id}:{date_col}"
+                    state["processed"][field_key] = normalize_date_for_comparison(cell.value)
 
     # Save state
     save_state(state)
@@ -374,7 +419,6 @@ def test_changes():
         return False
 
     # Remove one item to force detection
-    import random
     key_to_remove = random.choice(list(processed.keys()))
     logger.info(f"Removing key {key_to_remove} to force change detection")
     processed.pop(key_to_remove, None)